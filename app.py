@@ -16,19 +16,128 @@ Features:
 - Notifications for high latency / Internet down
 """
 
+import multiprocessing
 import os
 import sys
-from typing import List
+from typing import Optional
 
+import numpy as np
 from PyQt6 import QtWidgets, QtGui, QtCore
 import pyqtgraph as pg
 
-from monitor import NetworkMonitor
+from monitor import NetworkMonitor, Sample
 from graph_generator import generate_graphs
 from utils import BASE_DIR, LOG_FILE_PATH
 
+# PyOpenGL is optional: when present, the live graphs are drawn through
+# OpenGL instead of the CPU-side QPainterPath raster path.
+try:
+    import OpenGL  # noqa: F401
+    _HAS_OPENGL = True
+except ImportError:
+    _HAS_OPENGL = False
+
+
+class _RingBuffer:
+    """
+    Fixed-size float32 history for the live graphs.
+
+    Every value is written twice (at i and i + size), so the most recent
+    `size` values are always one contiguous slice and can be handed to
+    pyqtgraph as a view, without shifting or copying.
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+        self._data = np.empty(2 * size, dtype=np.float32)
+        self._head = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, value: float):
+        i = self._head
+        self._data[i] = value
+        self._data[i + self.size] = value
+        self._head = (i + 1) % self.size
+        if self._count < self.size:
+            self._count += 1
+
+    def values(self) -> np.ndarray:
+        if self._count < self.size:
+            return self._data[:self._count]
+        return self._data[self._head:self._head + self.size]
+
+
+PLOT_BACKGROUND = QtGui.QColor(18, 18, 18)
+
+# Live graph pens, built once and shared instead of re-parsing color strings
+PEN_LATENCY = pg.mkPen("y", width=1)
+PEN_DOWNLOAD = pg.mkPen("c", width=1)
+PEN_UPLOAD = pg.mkPen("m", width=1)
+PEN_SIGNAL = pg.mkPen("g", width=1)
+
+
+def _num_formatter(spec: Optional[str] = None):
+    """
+    Build a label formatter for a numeric field: "-" when empty, otherwise
+    format(value, spec). A fixed spec keeps the text stable between samples,
+    so unchanged values don't trigger a label repaint.
+    """
+    def fmt(value) -> str:
+        if value in ("", None):
+            return "-"
+        if spec is None:
+            return str(value)
+        try:
+            return format(value, spec)
+        except (TypeError, ValueError):
+            return str(value)
+    return fmt
+
+
+_fmt_num = _num_formatter()
+_fmt_0f = _num_formatter(".0f")
+_fmt_1f = _num_formatter(".1f")
+_fmt_2f = _num_formatter(".2f")
+_fmt_3f = _num_formatter(".3f")
+
+
+def _fmt_str(value) -> str:
+    return value or "-"
+
+
+def _fmt_yes_no(value) -> str:
+    return "Yes" if value == 1 else "No"
+
+
+class _GenerateGraphsSignals(QtCore.QObject):
+    done = QtCore.pyqtSignal(list)
+    failed = QtCore.pyqtSignal(str)
+
+
+class GenerateGraphsTask(QtCore.QRunnable):
+    """
+    Runs generate_graphs() on a QThreadPool thread so the GUI stays responsive.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.signals = _GenerateGraphsSignals()
+
+    def run(self):
+        try:
+            paths = generate_graphs()
+        except Exception as exc:
+            self.signals.failed.emit(str(exc))
+            return
+        self.signals.done.emit(paths)
+
 
 class MainWindow(QtWidgets.QMainWindow):
+    _ICON: Optional[QtGui.QIcon] = None
+
     def __init__(self):
         super().__init__()
 
@@ -46,8 +155,11 @@ class MainWindow(QtWidgets.QMainWindow):
 
         # Network monitor (interval from spinbox)
         self.monitor = NetworkMonitor(interval_seconds=self.interval_spin.value())
-        self.monitor.data_collected.connect(self.on_data_collected)
+        self.monitor.data_collected.connect(
+            self._on_sample_queued, QtCore.Qt.ConnectionType.QueuedConnection
+        )
         self.monitor.error_occurred.connect(self.on_monitor_error)
+        self.monitor.set_adaptive(self.adaptive_check.isChecked())
         self.monitor.start()
 
     # ------------------------------------------------------------------ #
@@ -138,6 +250,44 @@ class MainWindow(QtWidgets.QMainWindow):
 
         status_hbox.addWidget(local_group, stretch=1)
 
+        # label -> (Sample field, formatter), applied in on_data_collected
+        self._label_bindings = [
+            (self.lbl_latency, "latency_ms", _fmt_2f),
+            (self.lbl_jitter, "jitter_ms", _fmt_2f),
+            (self.lbl_http_latency, "http_latency_ms", _fmt_2f),
+            (self.lbl_packet_loss, "packet_loss_pct", _fmt_1f),
+            (self.lbl_download, "download_mbps", _fmt_2f),
+            (self.lbl_upload, "upload_mbps", _fmt_2f),
+            (self.lbl_public_ip, "public_ip", _fmt_str),
+            (self.lbl_isp_hop1_ip, "isp_hop1_ip", _fmt_str),
+            (self.lbl_isp_hop1_latency, "isp_hop1_latency_ms", _fmt_2f),
+            (self.lbl_isp_hop1_loss, "isp_hop1_loss_pct", _fmt_1f),
+            (self.lbl_isp_hop2_ip, "isp_hop2_ip", _fmt_str),
+            (self.lbl_isp_hop2_latency, "isp_hop2_latency_ms", _fmt_2f),
+            (self.lbl_isp_hop2_loss, "isp_hop2_loss_pct", _fmt_1f),
+            (self.lbl_status, "status", _fmt_str),
+            (self.lbl_stability_score, "stability_score", _fmt_num),
+            (self.lbl_meeting_score, "meeting_quality_score", _fmt_num),
+            (self.lbl_gateway, "gateway", _fmt_str),
+            (self.lbl_router_latency, "router_latency_ms", _fmt_2f),
+            (self.lbl_router_loss, "router_packet_loss_pct", _fmt_1f),
+            (self.lbl_sonicwall_cpu, "sonicwall_cpu_pct", _fmt_0f),
+            (self.lbl_sonicwall_sessions, "sonicwall_sessions", _fmt_0f),
+            (self.lbl_sonicwall_wan_in, "sonicwall_wan_in_mbps", _fmt_3f),
+            (self.lbl_sonicwall_wan_out, "sonicwall_wan_out_mbps", _fmt_3f),
+            (self.lbl_vpn_active, "vpn_active", _fmt_yes_no),
+            (self.lbl_vpn_latency, "vpn_latency_ms", _fmt_2f),
+            (self.lbl_vpn_loss, "vpn_packet_loss_pct", _fmt_1f),
+            (self.lbl_local_ip, "local_ip", _fmt_str),
+            (self.lbl_iface_name, "iface_name", _fmt_str),
+            (self.lbl_dns, "dns", _fmt_str),
+            (self.lbl_signal, "signal_strength", _fmt_0f),
+            (self.lbl_cpu_pct, "cpu_pct", _fmt_1f),
+            (self.lbl_mem_pct, "mem_pct", _fmt_1f),
+            (self.lbl_nic_up, "nic_up_mbps", _fmt_3f),
+            (self.lbl_nic_down, "nic_down_mbps", _fmt_3f),
+        ]
+
         # --- Middle: Live graphs ---
         self.graph_group = QtWidgets.QGroupBox("Live Graphs")
         self.graph_group.setObjectName("graph_group")
@@ -145,33 +295,60 @@ class MainWindow(QtWidgets.QMainWindow):
         self.graph_group.setLayout(graphs_layout)
 
         # PyQtGraph dark theme
-        pg.setConfigOption("background", (18, 18, 18))
+        pg.setConfigOption("background", PLOT_BACKGROUND)
         pg.setConfigOption("foreground", "w")
-
-        self.latency_plot = pg.PlotWidget(title="Latency (ms)")
-        self.download_plot = pg.PlotWidget(title="Download (Mbps)")
-        self.upload_plot = pg.PlotWidget(title="Upload (Mbps)")
-        self.signal_plot = pg.PlotWidget(title="Wi-Fi Signal (%)")
-
-        graphs_layout.addWidget(self.latency_plot, 0, 0)
-        graphs_layout.addWidget(self.download_plot, 0, 1)
-        graphs_layout.addWidget(self.upload_plot, 1, 0)
-        graphs_layout.addWidget(self.signal_plot, 1, 1)
+        if _HAS_OPENGL:
+            pg.setConfigOption("useOpenGL", True)
+            pg.setConfigOption("enableExperimental", True)
+
+        # One GraphicsLayoutWidget (one scene, one paint pass) holding four
+        # plots. Y-ranges stay independent (ms / Mbps / %); X is linked.
+        self.graphs_view = pg.GraphicsLayoutWidget()
+        self.latency_plot = self.graphs_view.addPlot(row=0, col=0, title="Latency (ms)")
+        self.download_plot = self.graphs_view.addPlot(row=0, col=1, title="Download (Mbps)")
+        self.upload_plot = self.graphs_view.addPlot(row=1, col=0, title="Upload (Mbps)")
+        self.signal_plot = self.graphs_view.addPlot(row=1, col=1, title="Wi-Fi Signal (%)")
+        for plot in (self.download_plot, self.upload_plot, self.signal_plot):
+            plot.setXLink(self.latency_plot)
+
+        if _HAS_OPENGL:
+            self.graphs_view.useOpenGL(True)
+            self.graphs_view.setAntialiasing(False)  # antialiasing disables the GL fast path
+
+        graphs_layout.addWidget(self.graphs_view, 0, 0)
 
         main_layout.addWidget(self.graph_group, stretch=1)
 
         # Data buffers
         self.max_points = 100
-        self.latency_data: List[float] = []
-        self.download_data: List[float] = []
-        self.upload_data: List[float] = []
-        self.signal_data: List[float] = []
+        # Shared x-axis (sample index) for all four curves, built once and sliced
+        self._x_axis = np.arange(self.max_points, dtype=np.float32)
+        self.latency_data = _RingBuffer(self.max_points)
+        self.download_data = _RingBuffer(self.max_points)
+        self.upload_data = _RingBuffer(self.max_points)
+        self.signal_data = _RingBuffer(self.max_points)
+
+        # Fixed x-range (no bounds recomputation on every setData), plus
+        # peak downsampling and view clipping to keep the vertex count low.
+        for plot in (self.latency_plot, self.download_plot, self.upload_plot, self.signal_plot):
+            plot.setDownsampling(auto=True, mode="peak")
+            plot.setClipToView(True)
+            plot.setXRange(0, self.max_points - 1, padding=0)
 
         # Plot curves
-        self.latency_curve = self.latency_plot.plot(pen="y")
-        self.download_curve = self.download_plot.plot(pen="c")
-        self.upload_curve = self.upload_plot.plot(pen="m")
-        self.signal_curve = self.signal_plot.plot(pen="g")
+        self.latency_curve = self.latency_plot.plot(pen=PEN_LATENCY)
+        self.download_curve = self.download_plot.plot(pen=PEN_DOWNLOAD)
+        self.upload_curve = self.upload_plot.plot(pen=PEN_UPLOAD)
+        self.signal_curve = self.signal_plot.plot(pen=PEN_SIGNAL)
+
+        # Without OpenGL, cache the rendered line so repaints that don't
+        # change the data (hover, window activation, restoring from tray)
+        # skip paint(); setData() calls update(), which invalidates the cache.
+        # Not with OpenGL: a cached item paints into a pixmap (no GL widget),
+        # which would silently bypass pyqtgraph's GL curve path.
+        if not _HAS_OPENGL:
+            for curve in (self.latency_curve, self.download_curve, self.upload_curve, self.signal_curve):
+                curve.curve.setCacheMode(QtWidgets.QGraphicsItem.CacheMode.DeviceCoordinateCache)
 
         # --- Bottom: Controls ---
         control_group = QtWidgets.QGroupBox("Controls")
@@ -184,6 +361,19 @@ class MainWindow(QtWidgets.QMainWindow):
         self.interval_spin.setValue(5)  # default 5 seconds
         self.interval_spin.valueChanged.connect(self.on_interval_changed)
 
+        redraw_label = QtWidgets.QLabel("Max redraw rate (Hz):")
+        self.redraw_spin = QtWidgets.QSpinBox()
+        self.redraw_spin.setRange(1, 10)
+        self.redraw_spin.setValue(1)  # default 1 redraw per second
+        self.redraw_spin.valueChanged.connect(self.on_redraw_rate_changed)
+
+        self.adaptive_check = QtWidgets.QCheckBox("Adaptive polling")
+        self.adaptive_check.setToolTip(
+            "While the connection is OK and no interface changes, "
+            "run the full probes less often."
+        )
+        self.adaptive_check.toggled.connect(self.on_adaptive_toggled)
+
         self.btn_generate_graphs = QtWidgets.QPushButton("Generate Graphs from log.txt")
         self.btn_generate_graphs.clicked.connect(self.on_generate_graphs)
 
@@ -195,6 +385,9 @@ class MainWindow(QtWidgets.QMainWindow):
 
         control_layout.addWidget(interval_label)
         control_layout.addWidget(self.interval_spin)
+        control_layout.addWidget(redraw_label)
+        control_layout.addWidget(self.redraw_spin)
+        control_layout.addWidget(self.adaptive_check)
         control_layout.addStretch(1)
         control_layout.addWidget(self.btn_generate_graphs)
         control_layout.addWidget(self.btn_show_log)
@@ -205,6 +398,20 @@ class MainWindow(QtWidgets.QMainWindow):
         # Status bar
         self.statusBar().showMessage("Monitoring started…")
 
+        # Latest sample waiting to be applied (bursts collapse to one)
+        self._pending_sample: Optional[Sample] = None
+        self._sample_scheduled = False
+
+        # Redraw timer: single-shot, armed when an update is queued, so labels
+        # and curves are repainted at most at the max redraw rate and the
+        # timer never wakes while nothing is pending (e.g. idle in the tray).
+        self._pending_labels: dict = {}
+        self._plots_dirty = False
+        self._redraw_timer = QtCore.QTimer(self)
+        self._redraw_timer.setSingleShot(True)
+        self._redraw_timer.setInterval(1000 // self.redraw_spin.value())
+        self._redraw_timer.timeout.connect(self._flush_updates)
+
         # Right side of status bar
         creator_label = QtWidgets.QLabel("Created by Damith")
         creator_label.setStyleSheet("color: #aaaaaa; padding-right: 8px;")
@@ -213,13 +420,22 @@ class MainWindow(QtWidgets.QMainWindow):
     # ------------------------------------------------------------------ #
     # Tray
     # ------------------------------------------------------------------ #
+    def _app_icon(self) -> QtGui.QIcon:
+        """
+        Load the tray icon once (decoded to a pixmap up front) and reuse it.
+        """
+        if MainWindow._ICON is None:
+            icon_path = os.path.join(BASE_DIR, "assets", "icon.png")
+            pixmap = QtGui.QPixmap(icon_path) if os.path.isfile(icon_path) else QtGui.QPixmap()
+            if not pixmap.isNull():
+                MainWindow._ICON = QtGui.QIcon(pixmap)
+            else:
+                MainWindow._ICON = self.style().standardIcon(QtWidgets.QStyle.StandardPixmap.SP_ComputerIcon)
+        return MainWindow._ICON
+
     def _setup_tray(self):
         self.tray = QtWidgets.QSystemTrayIcon(self)
-        icon_path = os.path.join(BASE_DIR, "assets", "icon.png")
-        if os.path.isfile(icon_path):
-            self.tray.setIcon(QtGui.QIcon(icon_path))
-        else:
-            self.tray.setIcon(self.style().standardIcon(QtWidgets.QStyle.StandardPixmap.SP_ComputerIcon))
+        self.tray.setIcon(self._app_icon())
 
         tray_menu = QtWidgets.QMenu()
         action_show = tray_menu.addAction("Show")
@@ -264,112 +480,87 @@ class MainWindow(QtWidgets.QMainWindow):
     # ------------------------------------------------------------------ #
     # Monitor callbacks
     # ------------------------------------------------------------------ #
-    @QtCore.pyqtSlot(dict)
-    def on_data_collected(self, sample: dict):
-        latency = sample["latency_ms"]
-        jitter = sample["jitter_ms"]
-        download = sample["download_mbps"]
-        upload = sample["upload_mbps"]
-        signal = sample["signal_strength"]
-
-        # Internet / ISP
-        self.lbl_latency.setText(str(latency) if latency != "" else "-")
-        self.lbl_jitter.setText(str(jitter) if jitter != "" else "-")
-        self.lbl_http_latency.setText(
-            str(sample.get("http_latency_ms", "")) if sample.get("http_latency_ms", "") != "" else "-"
-        )
-        self.lbl_packet_loss.setText(
-            str(sample.get("packet_loss_pct", "")) if sample.get("packet_loss_pct", "") != "" else "-"
-        )
-        self.lbl_download.setText(str(download) if download != "" else "-")
-        self.lbl_upload.setText(str(upload) if upload != "" else "-")
-        self.lbl_public_ip.setText(sample.get("public_ip", "") or "-")
-
-        self.lbl_isp_hop1_ip.setText(sample.get("isp_hop1_ip", "") or "-")
-        self.lbl_isp_hop1_latency.setText(
-            str(sample.get("isp_hop1_latency_ms", "")) if sample.get("isp_hop1_latency_ms", "") != "" else "-"
-        )
-        self.lbl_isp_hop1_loss.setText(
-            str(sample.get("isp_hop1_loss_pct", "")) if sample.get("isp_hop1_loss_pct", "") != "" else "-"
-        )
-        self.lbl_isp_hop2_ip.setText(sample.get("isp_hop2_ip", "") or "-")
-        self.lbl_isp_hop2_latency.setText(
-            str(sample.get("isp_hop2_latency_ms", "")) if sample.get("isp_hop2_latency_ms", "") != "" else "-"
-        )
-        self.lbl_isp_hop2_loss.setText(
-            str(sample.get("isp_hop2_loss_pct", "")) if sample.get("isp_hop2_loss_pct", "") != "" else "-"
-        )
-
-        self.lbl_status.setText(sample.get("status", "") or "-")
-        self.lbl_stability_score.setText(str(sample.get("stability_score", "-")))
-        self.lbl_meeting_score.setText(str(sample.get("meeting_quality_score", "-")))
-
-        # Router / SonicWall
-        self.lbl_gateway.setText(sample.get("gateway", "") or "-")
-        self.lbl_router_latency.setText(
-            str(sample.get("router_latency_ms", "")) if sample.get("router_latency_ms", "") != "" else "-"
-        )
-        self.lbl_router_loss.setText(
-            str(sample.get("router_packet_loss_pct", "")) if sample.get("router_packet_loss_pct", "") != "" else "-"
-        )
-
-        cpu = sample.get("sonicwall_cpu_pct", "")
-        self.lbl_sonicwall_cpu.setText(str(cpu) if cpu != "" else "-")
-        sess = sample.get("sonicwall_sessions", "")
-        self.lbl_sonicwall_sessions.setText(str(sess) if sess != "" else "-")
-        self.lbl_sonicwall_wan_in.setText(
-            str(sample.get("sonicwall_wan_in_mbps", "")) if sample.get("sonicwall_wan_in_mbps", "") != "" else "-"
-        )
-        self.lbl_sonicwall_wan_out.setText(
-            str(sample.get("sonicwall_wan_out_mbps", "")) if sample.get("sonicwall_wan_out_mbps", "") != "" else "-"
-        )
-
-        # VPN
-        self.lbl_vpn_active.setText("Yes" if sample.get("vpn_active", 0) == 1 else "No")
-        self.lbl_vpn_latency.setText(
-            str(sample.get("vpn_latency_ms", "")) if sample.get("vpn_latency_ms", "") != "" else "-"
-        )
-        self.lbl_vpn_loss.setText(
-            str(sample.get("vpn_packet_loss_pct", "")) if sample.get("vpn_packet_loss_pct", "") != "" else "-"
-        )
-
-        # Local PC
-        self.lbl_local_ip.setText(sample.get("local_ip", "") or "-")
-        self.lbl_iface_name.setText(sample.get("iface_name", "") or "-")
-        self.lbl_dns.setText(sample.get("dns", "") or "-")
-        self.lbl_signal.setText(str(signal) if signal not in ("", None) else "-")
-        self.lbl_cpu_pct.setText(str(sample.get("cpu_pct", "")) if sample.get("cpu_pct", "") != "" else "-")
-        self.lbl_mem_pct.setText(str(sample.get("mem_pct", "")) if sample.get("mem_pct", "") != "" else "-")
-        self.lbl_nic_up.setText(
-            str(sample.get("nic_up_mbps", "")) if sample.get("nic_up_mbps", "") != "" else "-"
-        )
-        self.lbl_nic_down.setText(
-            str(sample.get("nic_down_mbps", "")) if sample.get("nic_down_mbps", "") != "" else "-"
-        )
+    @QtCore.pyqtSlot(object)
+    def _on_sample_queued(self, sample: Sample):
+        """
+        Keep only the newest sample; if the monitor emits a burst (e.g. after
+        sleep/resume), the queued emissions collapse into one update.
+        """
+        self._pending_sample = sample
+        if not self._sample_scheduled:
+            self._sample_scheduled = True
+            QtCore.QTimer.singleShot(0, self._apply_latest_sample)
+
+    def _apply_latest_sample(self):
+        self._sample_scheduled = False
+        sample = self._pending_sample
+        self._pending_sample = None
+        if sample is not None:
+            self.on_data_collected(sample)
+
+    def on_data_collected(self, sample: Sample):
+        latency = sample.latency_ms
+        download = sample.download_mbps
+        upload = sample.upload_mbps
+        signal = sample.signal_strength
+
+        for label, key, fmt in self._label_bindings:
+            self._set_label(label, fmt(getattr(sample, key)))
 
         # Graph update
-        def push(buf: List[float], value):
+        def push(buf: _RingBuffer, value):
             if value in ("", None):
                 return
             try:
                 buf.append(float(value))
             except (TypeError, ValueError):
                 return
-            if len(buf) > self.max_points:
-                del buf[0]
 
         push(self.latency_data, latency)
         push(self.download_data, download)
         push(self.upload_data, upload)
         push(self.signal_data, signal)
 
-        self.latency_curve.setData(list(range(len(self.latency_data))), self.latency_data)
-        self.download_curve.setData(list(range(len(self.download_data))), self.download_data)
-        self.upload_curve.setData(list(range(len(self.upload_data))), self.upload_data)
-        self.signal_curve.setData(list(range(len(self.signal_data))), self.signal_data)
+        self._plots_dirty = True
+        self._schedule_flush()
 
         # Notifications
-        self._handle_notifications(sample.get("status", ""))
+        self._handle_notifications(sample.status)
+
+    def _set_label(self, label: QtWidgets.QLabel, text: str):
+        """
+        Queue a label update; it is applied on the next redraw tick.
+        """
+        self._pending_labels[label] = text
+        self._schedule_flush()
+
+    def _schedule_flush(self):
+        if not self._redraw_timer.isActive():
+            self._redraw_timer.start()
+
+    def _flush_updates(self):
+        """
+        Redraw tick: apply queued label texts and replot the curves.
+        Labels whose text did not change are left alone.
+        """
+        if self._pending_labels:
+            pending = self._pending_labels
+            self._pending_labels = {}
+            for label, text in pending.items():
+                if label.text() != text:
+                    label.setText(text)
+
+        if not self._plots_dirty:
+            return
+        self._plots_dirty = False
+
+        for curve, buf in (
+            (self.latency_curve, self.latency_data),
+            (self.download_curve, self.download_data),
+            (self.upload_curve, self.upload_data),
+            (self.signal_curve, self.signal_data),
+        ):
+            curve.setData(self._x_axis[:len(buf)], buf.values())
 
     @QtCore.pyqtSlot(str)
     def on_monitor_error(self, msg: str):
@@ -413,8 +604,28 @@ class MainWindow(QtWidgets.QMainWindow):
             self.monitor.set_interval(value)
         self.statusBar().showMessage(f"Interval set to {value} seconds")
 
+    def on_adaptive_toggled(self, checked: bool):
+        if hasattr(self, "monitor") and self.monitor:
+            self.monitor.set_adaptive(checked)
+        self.statusBar().showMessage(f"Adaptive polling {'enabled' if checked else 'disabled'}")
+
+    def on_redraw_rate_changed(self, value: int):
+        self._redraw_timer.setInterval(1000 // value)
+        self.statusBar().showMessage(f"Max redraw rate set to {value} Hz")
+
     def on_generate_graphs(self):
-        paths = generate_graphs()
+        self.btn_generate_graphs.setEnabled(False)
+        self.statusBar().showMessage("Generating graphs…")
+
+        task = GenerateGraphsTask()
+        task.signals.done.connect(self.on_graphs_generated)
+        task.signals.failed.connect(self.on_graphs_failed)
+        QtCore.QThreadPool.globalInstance().start(task)
+
+    @QtCore.pyqtSlot(list)
+    def on_graphs_generated(self, paths: list):
+        self.btn_generate_graphs.setEnabled(True)
+        self.statusBar().showMessage("Graph generation finished")
         if not paths:
             QtWidgets.QMessageBox.information(
                 self,
@@ -426,6 +637,12 @@ class MainWindow(QtWidgets.QMainWindow):
         msg = "Generated graphs:\n" + "\n".join(paths)
         QtWidgets.QMessageBox.information(self, "Generate Graphs", msg)
 
+    @QtCore.pyqtSlot(str)
+    def on_graphs_failed(self, msg: str):
+        self.btn_generate_graphs.setEnabled(True)
+        self.statusBar().showMessage("Graph generation failed")
+        QtWidgets.QMessageBox.warning(self, "Generate Graphs", f"Graph generation failed: {msg}")
+
     def on_open_log(self):
         if not os.path.isfile(LOG_FILE_PATH):
             with open(LOG_FILE_PATH, "w", encoding="utf-8") as f:
@@ -458,4 +675,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # Graph generation renders in worker processes; required for the frozen EXE.
+    multiprocessing.freeze_support()
     main()
@@ -1,119 +1,350 @@
 # graph_generator.py
 """
 Reads log.txt and generates PNG graphs using matplotlib.
+
+matplotlib is only imported inside the render worker processes, which are
+kept alive between runs, so neither the GUI process nor repeated
+"Generate Graphs" clicks pay its import cost.
 """
 
 import csv
+import mmap
 import os
-from typing import List, Dict
-from datetime import datetime
+import threading
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime, timedelta
+from typing import List, Dict, Optional, Tuple
 
-import matplotlib.pyplot as plt
-import matplotlib.dates as mdates
+import numpy as np
 
 from utils import LOG_FILE_PATH, BASE_DIR
 
+# Numeric log columns that get a graph
+GRAPH_COLUMNS = [
+    "latency_ms",
+    "jitter_ms",
+    "packet_loss_pct",
+    "router_latency_ms",
+    "router_packet_loss_pct",
+    "meet_latency_ms",
+    "meet_packet_loss_pct",
+    "download_mbps",
+    "upload_mbps",
+    "signal_strength",
+]
 
-def read_log() -> List[Dict[str, str]]:
-    if not os.path.isfile(LOG_FILE_PATH):
-        return []
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+TIMESTAMP_LEN = 19
 
-    rows: List[Dict[str, str]] = []
-    with open(LOG_FILE_PATH, encoding="utf-8", newline="") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            rows.append(row)
-    return rows
+# Render worker pool, created on first use and shut down again once it has
+# been idle for EXECUTOR_IDLE_SECONDS (each worker holds a matplotlib import)
+EXECUTOR_MAX_WORKERS = min(4, os.cpu_count() or 1)
+EXECUTOR_IDLE_SECONDS = 120.0
+_EXECUTOR: Optional[ProcessPoolExecutor] = None
+_EXECUTOR_USERS = 0
+_EXECUTOR_IDLE_TIMER: Optional[threading.Timer] = None
+_EXECUTOR_LOCK = threading.Lock()
 
+# M4 downsampling target: one bin per output pixel of the default
+# 6.4 in figure at 120 dpi. Each bin keeps at most 4 points.
+M4_BINS = 768
 
-def generate_graphs(output_dir: str | None = None) -> List[str]:
-    rows = read_log()
-    if not rows:
-        return []
 
-    if output_dir is None:
-        output_dir = BASE_DIR
+def _tail_start(mm: mmap.mmap, first_row: int, tail_days: float) -> int:
+    """
+    Byte offset of the first row within `tail_days` of the last row.
+
+    Builds a table of row start offsets, then binary-searches it on the
+    timestamp prefix of each row (log rows are chronological and the
+    fixed-width timestamp format sorts as bytes).
+    """
+    starts = [first_row]
+    pos = mm.find(b"\n", first_row)
+    while pos != -1:
+        if pos + 1 < len(mm):
+            starts.append(pos + 1)
+        pos = mm.find(b"\n", pos + 1)
+
+    last = mm[starts[-1]:starts[-1] + TIMESTAMP_LEN].decode("utf-8", errors="ignore")
+    try:
+        last_ts = datetime.strptime(last, TIMESTAMP_FORMAT)
+    except ValueError:
+        return first_row
+
+    cutoff = (last_ts - timedelta(days=tail_days)).strftime(TIMESTAMP_FORMAT).encode()
+    i = bisect_left(starts, cutoff, key=lambda p: mm[p:p + TIMESTAMP_LEN])
+    return starts[min(i, len(starts) - 1)]
+
+
+def _to_float(cells: List[str]) -> np.ndarray:
+    """
+    Float array from CSV cells; empty or malformed cells become NaN.
+    """
+    arr = np.array(cells, dtype=str)
+    arr = np.where(arr == "", "nan", arr)  # widens a short dtype to fit "nan"
+    try:
+        return arr.astype(np.float64)
+    except ValueError:
+        out = np.full(len(cells), np.nan)
+        for i, cell in enumerate(cells):
+            try:
+                out[i] = float(cell)
+            except ValueError:
+                pass
+        return out
 
-    timestamps = []
-    latency = []
-    jitter = []
-    packet_loss = []
-    router_latency = []
-    router_loss = []
-    meet_latency = []
-    meet_loss = []
-    download = []
-    upload = []
-    signal = []
-
-    for row in rows:
-        ts_str = row.get("timestamp", "")
-        try:
-            ts = datetime.strptime(ts_str, "%Y-%m-%d %H:%M:%S")
-        except Exception:
-            continue
-        timestamps.append(ts)
 
-        def parse_float(key: str):
-            val = row.get(key, "")
+def read_log(
+    columns: List[str] = GRAPH_COLUMNS,
+    tail_days: Optional[float] = None,
+) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+    """
+    Columnar parse of log.txt.
+    The file is memory-mapped and its rows are streamed; with `tail_days`
+    only the rows from the last N days (relative to the newest row) are read.
+
+    Returns:
+      (timestamps as datetime64[s], {column: float array}).
+      Empty cells become NaN; columns missing from the header are all NaN.
+      Rows with an unparsable timestamp are dropped.
+    """
+    empty = np.array([], dtype="datetime64[s]"), {}
+    if not os.path.isfile(LOG_FILE_PATH):
+        return empty
+
+    with open(LOG_FILE_PATH, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return empty
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            header_end = mm.find(b"\n")
+            if header_end == -1:
+                return empty
+            start = header_end + 1
+            if tail_days is not None:
+                start = _tail_start(mm, start, tail_days)
+            header = next(csv.reader([mm[:header_end].decode("utf-8", errors="ignore").rstrip("\r")]))
+            if "timestamp" not in header:
+                return empty
+            present = [c for c in columns if c in header]
+
+            # Stream the rows straight off the map so only the needed cells
+            # are ever held as strings, never the whole decoded file. Rows
+            # with the wrong field count (e.g. cut short by a crash
+            # mid-write) are dropped, so timestamps and values stay aligned.
+            mm.seek(start)
+            lines = (line.decode("utf-8", errors="ignore") for line in iter(mm.readline, b""))
+            width = len(header)
+            wanted = [header.index("timestamp")] + [header.index(c) for c in present]
+            cells: List[List[str]] = [[] for _ in wanted]
+            for row in csv.reader(lines):
+                if len(row) != width:
+                    continue
+                for col, i in zip(cells, wanted):
+                    col.append(row[i])
+    if not cells[0]:
+        return empty
+
+    ts_raw = np.array(cells[0], dtype="U19")
+    try:
+        timestamps = ts_raw.astype("datetime64[s]")
+    except ValueError:
+        # A malformed row somewhere: fall back to converting one by one
+        timestamps = np.full(len(ts_raw), np.datetime64("NaT"), dtype="datetime64[s]")
+        for i, ts in enumerate(ts_raw):
             try:
-                return float(val) if val != "" else None
+                timestamps[i] = np.datetime64(ts, "s")
             except ValueError:
-                return None
-
-        latency.append(parse_float("latency_ms"))
-        jitter.append(parse_float("jitter_ms"))
-        packet_loss.append(parse_float("packet_loss_pct"))
-        router_latency.append(parse_float("router_latency_ms"))
-        router_loss.append(parse_float("router_packet_loss_pct"))
-        meet_latency.append(parse_float("meet_latency_ms"))
-        meet_loss.append(parse_float("meet_packet_loss_pct"))
-        download.append(parse_float("download_mbps"))
-        upload.append(parse_float("upload_mbps"))
-        signal.append(parse_float("signal_strength"))
-
-    plt.style.use("dark_background")
-    filepaths: List[str] = []
-
-    def _time_plot(x, y, title, ylabel, filename):
-        x_clean = []
-        y_clean = []
-        for xv, yv in zip(x, y):
-            if yv is not None:
-                x_clean.append(xv)
-                y_clean.append(yv)
-        if not x_clean:
-            return None
-
-        fig, ax = plt.subplots()
-        ax.plot(x_clean, y_clean, marker="o", linestyle="-")
-        ax.set_title(title)
-        ax.set_xlabel("Time (JST)")
-        ax.set_ylabel(ylabel)
-        ax.xaxis.set_major_formatter(mdates.DateFormatter("%H:%M\n%Y-%m-%d"))
-        fig.autofmt_xdate()
-
-        path = os.path.join(output_dir, filename)
-        fig.savefig(path, dpi=120, bbox_inches="tight")
-        plt.close(fig)
-        return path
+                pass
+    valid = ~np.isnat(timestamps)
+
+    series: Dict[str, np.ndarray] = {}
+    for name, col in zip(present, cells[1:]):
+        series[name] = _to_float(col)[valid]
+    for name in columns:
+        if name not in series:
+            series[name] = np.full(int(valid.sum()), np.nan)
+
+    return timestamps[valid], series
+
+
+def _m4_downsample(x: np.ndarray, y: np.ndarray, bins: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    M4 aggregation: keep the first, last, min and max point of each bin.
+    Visually identical to the full series at `bins` pixels wide.
+    """
+    n = len(y)
+    if n <= 4 * bins:
+        return x, y
+
+    edges = np.linspace(0, n, bins + 1).astype(np.int64)
+    keep = [edges[:-1], edges[1:] - 1]
+    argmin = np.empty(bins, dtype=np.int64)
+    argmax = np.empty(bins, dtype=np.int64)
+    for i in range(bins):
+        lo, hi = edges[i], edges[i + 1]
+        chunk = y[lo:hi]
+        argmin[i] = lo + np.argmin(chunk)
+        argmax[i] = lo + np.argmax(chunk)
+    keep += [argmin, argmax]
+
+    idx = np.unique(np.concatenate(keep))
+    return x[idx], y[idx]
+
+
+# Per-worker Figure, created once and cleared between charts
+_FIGURE = None
+
+
+def _warm_worker():
+    """
+    Worker initializer: pay the matplotlib import once per worker process
+    and apply the dark style globally (the worker only renders graphs).
+    """
+    import matplotlib.dates  # noqa: F401
+    import matplotlib.figure  # noqa: F401
+    import matplotlib.style
+
+    matplotlib.style.use("dark_background")
+
+
+def _worker_axes():
+    """
+    Return the worker's reusable Axes, cleared for the next chart.
+    """
+    global _FIGURE
+    if _FIGURE is None:
+        from matplotlib.figure import Figure
+
+        _FIGURE = Figure()
+        _FIGURE.subplots()
+    ax = _FIGURE.axes[0]
+    ax.clear()
+    return ax
+
+
+def _acquire_executor() -> ProcessPoolExecutor:
+    """
+    Return the shared render pool (creating it if needed) and mark it busy
+    so the idle timer leaves it alone. Pair with _release_executor().
+    """
+    global _EXECUTOR, _EXECUTOR_USERS, _EXECUTOR_IDLE_TIMER
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR_IDLE_TIMER is not None:
+            _EXECUTOR_IDLE_TIMER.cancel()
+            _EXECUTOR_IDLE_TIMER = None
+        if _EXECUTOR is None:
+            _EXECUTOR = ProcessPoolExecutor(
+                max_workers=EXECUTOR_MAX_WORKERS,
+                initializer=_warm_worker,
+            )
+        _EXECUTOR_USERS += 1
+        return _EXECUTOR
+
+
+def _release_executor(executor: ProcessPoolExecutor, broken: bool = False):
+    """
+    Drop a broken pool right away so the next run gets a fresh one;
+    otherwise arm the idle shutdown once the last user is done.
+    """
+    global _EXECUTOR_USERS, _EXECUTOR_IDLE_TIMER
+    with _EXECUTOR_LOCK:
+        _EXECUTOR_USERS -= 1
+        if broken:
+            if _EXECUTOR is executor:
+                _discard_executor()
+        elif _EXECUTOR_USERS == 0 and _EXECUTOR is not None:
+            _EXECUTOR_IDLE_TIMER = threading.Timer(EXECUTOR_IDLE_SECONDS, _shutdown_idle_executor)
+            _EXECUTOR_IDLE_TIMER.daemon = True
+            _EXECUTOR_IDLE_TIMER.start()
+
+
+def _shutdown_idle_executor():
+    global _EXECUTOR_IDLE_TIMER
+    with _EXECUTOR_LOCK:
+        _EXECUTOR_IDLE_TIMER = None
+        if _EXECUTOR_USERS == 0:
+            _discard_executor()
+
+
+def _discard_executor():
+    """Shut the pool down without waiting. Caller holds _EXECUTOR_LOCK."""
+    global _EXECUTOR
+    if _EXECUTOR is not None:
+        _EXECUTOR.shutdown(wait=False, cancel_futures=True)
+        _EXECUTOR = None
+
+
+def _time_plot(x: np.ndarray, y: np.ndarray, title: str, ylabel: str, path: str) -> Optional[str]:
+    """
+    Render one time-series PNG. Module-level so it can run in a worker process.
+    Draws on a bare Figure (no pyplot), so no GUI backend is touched.
+    """
+    import matplotlib.dates as mdates
+
+    mask = ~np.isnan(y)
+    if not mask.any():
+        return None
+
+    x, y = _m4_downsample(x[mask], y[mask], M4_BINS)
+
+    ax = _worker_axes()
+    ax.plot(x, y, marker="o", linestyle="-")
+    ax.set_title(title)
+    ax.set_xlabel("Time (JST)")
+    ax.set_ylabel(ylabel)
+    ax.xaxis.set_major_formatter(mdates.DateFormatter("%H:%M\n%Y-%m-%d"))
+    ax.figure.autofmt_xdate()
+
+    ax.figure.savefig(path, dpi=120, bbox_inches="tight")
+    return path
+
+
+def generate_graphs(output_dir: str | None = None, tail_days: float | None = None) -> List[str]:
+    timestamps, series = read_log(tail_days=tail_days)
+    if not len(timestamps):
+        return []
+
+    if output_dir is None:
+        output_dir = BASE_DIR
 
     mappings = [
-        (latency, "Internet Latency (ms)", "Latency (ms)", "latency.png"),
-        (jitter, "Internet Jitter (ms)", "Jitter (ms)", "jitter.png"),
-        (packet_loss, "Internet Packet Loss (%)", "Loss (%)", "packet_loss.png"),
-        (router_latency, "Router Latency (ms)", "Latency (ms)", "router_latency.png"),
-        (router_loss, "Router Packet Loss (%)", "Loss (%)", "router_loss.png"),
-        (meet_latency, "Google Meet Latency (ms)", "Latency (ms)", "meet_latency.png"),
-        (meet_loss, "Google Meet Packet Loss (%)", "Loss (%)", "meet_loss.png"),
-        (download, "Download (Mbps)", "Download (Mbps)", "download.png"),
-        (upload, "Upload (Mbps)", "Upload (Mbps)", "upload.png"),
-        (signal, "Wi-Fi Signal (%)", "Signal (%)", "signal.png"),
+        ("latency_ms", "Internet Latency (ms)", "Latency (ms)", "latency.png"),
+        ("jitter_ms", "Internet Jitter (ms)", "Jitter (ms)", "jitter.png"),
+        ("packet_loss_pct", "Internet Packet Loss (%)", "Loss (%)", "packet_loss.png"),
+        ("router_latency_ms", "Router Latency (ms)", "Latency (ms)", "router_latency.png"),
+        ("router_packet_loss_pct", "Router Packet Loss (%)", "Loss (%)", "router_loss.png"),
+        ("meet_latency_ms", "Google Meet Latency (ms)", "Latency (ms)", "meet_latency.png"),
+        ("meet_packet_loss_pct", "Google Meet Packet Loss (%)", "Loss (%)", "meet_loss.png"),
+        ("download_mbps", "Download (Mbps)", "Download (Mbps)", "download.png"),
+        ("upload_mbps", "Upload (Mbps)", "Upload (Mbps)", "upload.png"),
+        ("signal_strength", "Wi-Fi Signal (%)", "Signal (%)", "signal.png"),
     ]
 
-    for series, title, ylabel, fname in mappings:
-        path = _time_plot(timestamps, series, title, ylabel, fname)
-        if path:
-            filepaths.append(path)
+    # Skip empty series here so no worker is spawned for them
+    tasks = [
+        (timestamps, series[key], title, ylabel, os.path.join(output_dir, fname))
+        for key, title, ylabel, fname in mappings
+        if not np.isnan(series[key]).all()
+    ]
+    if not tasks:
+        return []
 
-    return filepaths
+    # Each PNG is independent and Agg rendering is CPU-bound, so render
+    # them in separate processes. A worker that died (e.g. killed by the OS)
+    # breaks the whole pool, so retry once on a fresh one.
+    for attempt in range(2):
+        executor = _acquire_executor()
+        broken = False
+        try:
+            results = executor.map(_time_plot, *zip(*tasks))
+            filepaths: List[str] = [path for path in results if path]
+            return filepaths
+        except BrokenProcessPool:
+            broken = True
+            if attempt:
+                raise
+        finally:
+            _release_executor(executor, broken)
+    return []
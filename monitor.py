@@ -7,7 +7,7 @@ Features:
 - Packet loss to Internet (8.8.8.8)
 - Router (gateway) latency + loss
 - Google Meet latency + loss
-- ISP Hop 1 / Hop 2 latency + loss (from tracert -d -h 5 8.8.8.8)
+- ISP Hop 1 / Hop 2 latency + loss (from tracert -d -h 4 -w 500 8.8.8.8)
 - HTTP response latency (https://google.com)
 - VPN detection + latency + loss
 - SonicWall CPU (if SNMP is configured)
@@ -22,26 +22,32 @@ Features:
 import threading
 import time
 import csv
+import operator
 import os
 import statistics
 import subprocess
 import platform
+import re
+import socket
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, fields
 from datetime import datetime
 from zoneinfo import ZoneInfo
 from typing import Tuple, Optional, List
 
 import psutil
-from urllib.request import urlopen
 
-from ping3 import ping
-from speedtest import Speedtest
+from third_party.speedtest import Speedtest
 from PyQt6 import QtCore
 
 from utils import (
     LOG_FILE_PATH,
+    SPEEDTEST_CACHE_PATH,
     get_active_interface_info,
     get_public_ip,
+    http_request,
     is_vpn_active,
+    snapshot_interfaces,
     get_sonicwall_cpu_load,
     get_sonicwall_active_sessions,
     get_sonicwall_wan_octets,
@@ -58,6 +64,92 @@ if platform.system() == "Windows":
     HIDE_WINDOW = subprocess.STARTUPINFO()
     HIDE_WINDOW.dwFlags |= subprocess.STARTF_USESHOWWINDOW
 
+IS_WINDOWS = platform.system() == "Windows"
+
+# --- Windows ICMP helper API (no admin rights, no per-echo socket/process) ---
+_HAS_ICMP_API = False
+if IS_WINDOWS:
+    try:
+        import ctypes
+        from ctypes import wintypes
+
+        class _IP_OPTION_INFORMATION(ctypes.Structure):
+            _fields_ = [
+                ("Ttl", ctypes.c_ubyte),
+                ("Tos", ctypes.c_ubyte),
+                ("Flags", ctypes.c_ubyte),
+                ("OptionsSize", ctypes.c_ubyte),
+                ("OptionsData", ctypes.c_void_p),
+            ]
+
+        class _ICMP_ECHO_REPLY(ctypes.Structure):
+            _fields_ = [
+                ("Address", ctypes.c_ulong),
+                ("Status", ctypes.c_ulong),
+                ("RoundTripTime", ctypes.c_ulong),
+                ("DataSize", ctypes.c_ushort),
+                ("Reserved", ctypes.c_ushort),
+                ("Data", ctypes.c_void_p),
+                ("Options", _IP_OPTION_INFORMATION),
+            ]
+
+        _iphlpapi = ctypes.WinDLL("iphlpapi")
+        _IcmpCreateFile = _iphlpapi.IcmpCreateFile
+        _IcmpCreateFile.restype = wintypes.HANDLE
+        _IcmpCreateFile.argtypes = []
+        _IcmpSendEcho = _iphlpapi.IcmpSendEcho
+        _IcmpSendEcho.restype = wintypes.DWORD
+        _IcmpSendEcho.argtypes = [
+            wintypes.HANDLE, ctypes.c_ulong, ctypes.c_void_p, wintypes.WORD,
+            ctypes.c_void_p, ctypes.c_void_p, wintypes.DWORD, wintypes.DWORD,
+        ]
+        _HAS_ICMP_API = True
+    except (ImportError, OSError, AttributeError):
+        _HAS_ICMP_API = False
+
+_ICMP_PAYLOAD = b"internet-speed-monitor-ping".ljust(32, b"\0")
+_icmp_local = threading.local()  # one persistent ICMP handle per probe thread
+
+# Log timestamps are JST
+_JST = ZoneInfo("Asia/Tokyo")
+_TS_FMT = "%Y-%m-%d %H:%M:%S"
+
+# OS ping output parsing. A reply line carries "TTL=" and a "=12ms" / "<1ms"
+# / "time=12.3 ms" value in every locale we support.
+_PING_TTL_RE = re.compile(r"\bttl=", re.IGNORECASE)
+_PING_TIME_RE = re.compile(r"[=<]\s*(\d+(?:\.\d+)?)\s*ms\b")
+
+# Public IP is re-fetched after this many seconds (or on interface change)
+PUBLIC_IP_TTL = 900
+
+# Re-select the speedtest server after this many seconds
+SPEEDTEST_SERVER_TTL = 3600
+
+# Max seconds to wait for an HTTP / public IP / SNMP probe result
+PROBE_RESULT_TIMEOUT = 8.0
+
+# Flush log.txt at most this often (seconds). At intervals of this or
+# longer every row is flushed as it is written; shorter intervals batch rows.
+LOG_FLUSH_MIN_SECONDS = 5.0
+
+# On stop(), wait this long (seconds) for the monitor thread to finish
+STOP_JOIN_SECONDS = 3.0
+
+# Emit data_collected at most this often (seconds) while the status is
+# unchanged; a status change is always emitted at once. Every sample is
+# still logged.
+EMIT_MIN_SECONDS = 5.0
+
+# Minimum age (seconds) before psutil per-NIC counters are re-read
+PERNIC_TTL = 1.0
+
+# Minimum age (seconds) before CPU / memory usage are re-read
+CPU_MIN_INTERVAL = 1.0
+MEM_TTL = 2.0
+
+# tracert hop line: hop number first, IPv4 address last
+_HOP_RE = re.compile(r"\s*(\d+)\s+.*?(\d{1,3}(?:\.\d{1,3}){3})\s*$")
+
 # Hosts we test against
 PUBLIC_PING_HOST = "8.8.8.8"          # Internet baseline
 MEET_HOST = "meet.google.com"         # Main meeting platform
@@ -65,17 +157,184 @@ MEET_HOST = "meet.google.com"         # Main meeting platform
 # If you know a specific VPN gateway IP, you could set it here.
 VPN_TEST_HOST: Optional[str] = None
 
+# Adaptive polling: while the network is OK and no interface changed state,
+# run the full probe set only every N+1 intervals.
+ADAPTIVE_MAX_SKIP = 5
+
+
+@dataclass(slots=True)
+class Sample:
+    """
+    One monitoring measurement, emitted to the GUI and written to log.txt.
+    Field order matches the log.txt columns. Unmeasured numeric values are "".
+    """
+
+    timestamp: str
+
+    # Internet (8.8.8.8)
+    latency_ms: float | str
+    jitter_ms: float | str
+    packet_loss_pct: float | str
+    http_latency_ms: float | str
+
+    # Router
+    router_latency_ms: float | str
+    router_packet_loss_pct: float | str
+
+    # ISP Hops
+    isp_hop1_ip: str
+    isp_hop1_latency_ms: float | str
+    isp_hop1_loss_pct: float | str
+    isp_hop2_ip: str
+    isp_hop2_latency_ms: float | str
+    isp_hop2_loss_pct: float | str
+
+    # Google Meet
+    meet_latency_ms: float | str
+    meet_packet_loss_pct: float | str
+
+    # VPN
+    vpn_active: int  # 1 or 0
+    vpn_latency_ms: float | str
+    vpn_packet_loss_pct: float | str
+
+    # SonicWall
+    sonicwall_cpu_pct: float | str
+    sonicwall_sessions: float | str
+    sonicwall_wan_in_mbps: float | str
+    sonicwall_wan_out_mbps: float | str
+
+    # Speedtest
+    download_mbps: float | str
+    upload_mbps: float | str
+
+    # Local machine
+    signal_strength: int | str | None
+    local_ip: str | None
+    gateway: str | None
+    dns: str
+    public_ip: str | None
+    iface_name: str | None
+    cpu_pct: float
+    mem_pct: float
+    nic_up_mbps: float | str
+    nic_down_mbps: float | str
+
+    # Scores
+    stability_score: int
+    meeting_quality_score: int
+
+    status: str
+
+
+def _blank_if_none(value):
+    """
+    Sample/log.txt convention: a missing measurement is "".
+    """
+    return "" if value is None else value
+
+
+# log.txt columns, in Sample field order
+_CSV_KEYS = tuple(f.name for f in fields(Sample))
+_sample_row = operator.attrgetter(*_CSV_KEYS)
+
+
+def _result_or_none(future: Future, timeout: float = PROBE_RESULT_TIMEOUT):
+    """
+    Result of a non-ping probe future; None if it timed out or raised.
+    """
+    try:
+        return future.result(timeout=timeout)
+    except Exception:
+        return None
+
+
+def _icmp_ping(
+    host: str, count: int, timeout: float, stop: Optional[threading.Event] = None
+) -> Optional[List[float]]:
+    """
+    Send `count` echoes through the Windows ICMP API on this thread's
+    persistent handle and return the reply times (ms).
+    Stops early once `stop` is set, so shutdown waits for one echo at most.
+    Returns None when the API is unavailable, so the caller falls back to
+    the OS `ping` command.
+    """
+    if not _HAS_ICMP_API:
+        return None
+
+    handle = getattr(_icmp_local, "handle", None)
+    if handle is None:
+        handle = _IcmpCreateFile()
+        if not handle or handle == wintypes.HANDLE(-1).value:
+            return None
+        _icmp_local.handle = handle
+        _icmp_local.reply = ctypes.create_string_buffer(
+            ctypes.sizeof(_ICMP_ECHO_REPLY) + len(_ICMP_PAYLOAD) + 8
+        )
+
+    try:
+        addr = int.from_bytes(socket.inet_aton(socket.gethostbyname(host)), "little")
+    except OSError:
+        return []
+
+    reply_buf = _icmp_local.reply
+    timeout_ms = int(timeout * 1000)
+    latencies: List[float] = []
+    for _ in range(count):
+        if stop is not None and stop.is_set():
+            break
+        if _IcmpSendEcho(handle, addr, _ICMP_PAYLOAD, len(_ICMP_PAYLOAD), None,
+                         reply_buf, len(reply_buf), timeout_ms):
+            reply = _ICMP_ECHO_REPLY.from_buffer(reply_buf)
+            if reply.Status == 0:  # IP_SUCCESS
+                latencies.append(float(reply.RoundTripTime))
+    return latencies
+
+
+def _ping_command(host: str, count: int, timeout: float) -> List[str]:
+    if IS_WINDOWS:
+        return ["ping", "-n", str(count), "-w", str(int(timeout * 1000)), host]
+    return ["ping", "-c", str(count), "-W", str(max(1, int(round(timeout)))), "-i", "0.2", host]
+
+
+def _run_os_ping(host: str, count: int, timeout: float) -> List[float]:
+    """
+    Run one OS `ping` for all `count` echoes and return the reply times (ms).
+    Reply lines are recognised by their TTL field, so this works with both
+    English and Japanese Windows output (and POSIX ping).
+    """
+    try:
+        proc = subprocess.run(
+            _ping_command(host, count, timeout),
+            capture_output=True,
+            encoding="utf-8",
+            errors="ignore",
+            timeout=count * (timeout + 1.0) + 2.0,
+            startupinfo=HIDE_WINDOW,
+            creationflags=CREATE_NO_WINDOW,
+        )
+    except Exception:
+        return []
+
+    latencies: List[float] = []
+    for line in proc.stdout.splitlines():
+        if not _PING_TTL_RE.search(line):
+            continue
+        m = _PING_TIME_RE.search(line)
+        if m:
+            latencies.append(float(m.group(1)))
+    return latencies[:count]
+
 
 def get_http_latency(url: str = "https://google.com", timeout: float = 5.0) -> Optional[float]:
     """
-    Simple HTTP latency check (ms). Returns None on error.
+    Simple HTTP latency check (ms, unrounded). Returns None on error.
+    A HEAD request over a kept-alive connection, so after the first sample
+    this is request/response time without the TCP/TLS handshake.
     """
     try:
-        start = time.time()
-        with urlopen(url, timeout=timeout) as resp:
-            resp.read(100)  # small read to force real connection
-        end = time.time()
-        return round((end - start) * 1000.0, 2)
+        _, _, elapsed = http_request(url, "HEAD", timeout)
+        return elapsed * 1000.0
     except Exception:
         return None
 
@@ -86,7 +345,7 @@ class NetworkMonitor(QtCore.QObject):
     Emits data to the GUI using Qt signals.
     """
 
-    data_collected = QtCore.pyqtSignal(dict)
+    data_collected = QtCore.pyqtSignal(Sample)
     error_occurred = QtCore.pyqtSignal(str)
 
     def __init__(self, interval_seconds=60, parent=None):
@@ -97,10 +356,38 @@ class NetworkMonitor(QtCore.QObject):
         self._thread = None
         self._lock = threading.Lock()
 
+        # log.txt handle, opened by the monitor thread on first write
+        self._log_fh = None
+        self._log_writer = None
+        self._log_last_flush = 0.0
+        self._log_lock = threading.Lock()
+        self._last_emit = 0.0
+        self._last_emitted_status = None
+
+        # Worker threads for concurrent probes within one sample; created by
+        # start() and shut down by stop()
+        self._pool: Optional[ThreadPoolExecutor] = None
+
+        # Adaptive polling state
+        self._adaptive = False
+        self._skipped = 0
+        self._last_status: Optional[str] = None
+        self._last_if_state: Optional[dict] = None
+
         # Speedtest management
         self._speedtest_running = False
         self._speedtest_result = None  # {"download": float, "upload": float}
         self._speedtest_counter = 0    # run every N intervals
+        self._speedtest: Optional[Speedtest] = None
+        self._speedtest_best_ts = 0.0
+
+        # Public IP cache: (ip, monotonic fetch time), refreshed every
+        # PUBLIC_IP_TTL seconds or when the active interface changes
+        self._public_ip_cache: Tuple[Optional[str], float] = (None, float("-inf"))
+        self._last_iface: Optional[str] = None
+
+        # DNS servers of the last sample and their joined log form
+        self._last_dns: Tuple[tuple, str] = ((), "")
 
         # ISP hop discovery (from tracert)
         self._isp_hops: List[str] = []
@@ -109,6 +396,12 @@ class NetworkMonitor(QtCore.QObject):
         # NIC throughput tracking
         self._last_nic_counters = None
         self._last_nic_time: Optional[float] = None
+        self._pernic_cache: Optional[dict] = None
+        self._pernic_time = 0.0
+
+        # Cached CPU / memory readings: (monotonic time, value)
+        self._last_cpu: Tuple[float, float] = (float("-inf"), 0.0)
+        self._last_mem: Tuple[float, float] = (float("-inf"), 0.0)
 
         # SonicWall WAN octet tracking (optional)
         self._last_wan_octets = None
@@ -121,44 +414,131 @@ class NetworkMonitor(QtCore.QObject):
         with self._lock:
             self.interval_seconds = max(1, int(seconds))
 
+    def set_adaptive(self, enabled: bool):
+        with self._lock:
+            self._adaptive = bool(enabled)
+            self._skipped = 0
+
     def start(self):
         if self._thread and self._thread.is_alive():
             return
         self._stop_event.clear()
+        self._pool = ThreadPoolExecutor(max_workers=12, thread_name_prefix="probe")
         self._thread = threading.Thread(target=self._run_loop, daemon=True)
         self._thread.start()
 
     def stop(self):
         self._stop_event.set()
+        # Pool threads are joined at interpreter exit, so drop queued probes
+        # now; running ones return within their own (bounded) timeouts.
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+        # The monitor thread is a daemon and dies with the app, so its own
+        # _close_log() may never run: close the log here so rows still
+        # buffered between flushes are written.
+        if self._thread is not None:
+            self._thread.join(STOP_JOIN_SECONDS)
+        with self._log_lock:
+            self._close_log()
 
     # ------------------------------------------------------------------ #
     # Main Loop
     # ------------------------------------------------------------------ #
     def _run_loop(self):
-        while not self._stop_event.is_set():
-            try:
-                sample = self._take_sample()
-                self._append_to_log(sample)
-                self.data_collected.emit(sample)
-            except Exception as exc:
-                self.error_occurred.emit(f"Monitoring error: {exc}")
-
-            for _ in range(self.interval_seconds):
-                if self._stop_event.is_set():
+        try:
+            while not self._stop_event.is_set():
+                try:
+                    if self._should_sample():
+                        sample = self._take_sample()
+                        if self._stop_event.is_set():
+                            # Cut short by stop(): pings that broke off
+                            # early would read as packet loss
+                            return
+                        self._last_status = sample.status
+                        # Emit first: the queued signal returns at once, so
+                        # the GUI handles the sample while the row is written
+                        if self._should_emit(sample):
+                            self.data_collected.emit(sample)
+                        self._append_to_log(sample)
+                except Exception as exc:
+                    if self._stop_event.is_set():
+                        return  # probes cancelled by stop()
+                    self.error_occurred.emit(f"Monitoring error: {exc}")
+
+                with self._lock:
+                    interval = self.interval_seconds
+                if self._stop_event.wait(interval):
                     return
-                time.sleep(1)
+        finally:
+            with self._log_lock:
+                self._close_log()
+
+    def _should_emit(self, sample: Sample) -> bool:
+        """
+        Debounce GUI updates for sub-EMIT_MIN_SECONDS intervals: emit when
+        the status changed or EMIT_MIN_SECONDS passed since the last emit.
+        """
+        now = time.monotonic()
+        if (
+            sample.status == self._last_emitted_status
+            and now - self._last_emit < EMIT_MIN_SECONDS
+        ):
+            return False
+        self._last_emit = now
+        self._last_emitted_status = sample.status
+        return True
+
+    # ------------------------------------------------------------------ #
+    # Adaptive polling
+    # ------------------------------------------------------------------ #
+    def _interfaces_changed(self) -> bool:
+        """
+        Cheap local check (no network traffic): did any interface go
+        up/down or change link speed since the last interval?
+        """
+        try:
+            _, stats = snapshot_interfaces()
+            state = {name: (s.isup, s.speed) for name, s in stats.items()}
+        except Exception:
+            return True
+        changed = state != self._last_if_state
+        self._last_if_state = state
+        return changed
+
+    def _should_sample(self) -> bool:
+        """
+        Decide whether this interval runs the full probe set.
+        Always True unless adaptive polling is enabled; then probes are skipped
+        while the last status was OK and no interface changed, up to
+        ADAPTIVE_MAX_SKIP intervals in a row.
+        """
+        changed = self._interfaces_changed()
+        with self._lock:
+            if (
+                not self._adaptive
+                or changed
+                or self._last_status != "OK"
+                or self._skipped >= ADAPTIVE_MAX_SKIP
+            ):
+                self._skipped = 0
+                return True
+            self._skipped += 1
+            return False
 
     # ------------------------------------------------------------------ #
-    # Traceroute-based ISP hop discovery (one-time)
+    # Traceroute-based ISP hop discovery (startup + interface change)
     # ------------------------------------------------------------------ #
     def _detect_isp_hops(self):
         """
-        Runs 'tracert -d -h 5 8.8.8.8' once and stores the first 2 hop IPs.
+        Runs 'tracert -d -h 4 -w 500 8.8.8.8' and stores the first 2 hop IPs
+        that answer. Tracing up to 4 hops means a hop that drops ICMP is
+        skipped rather than leaving Hop 2 blank.
+        Called at startup and again when the active interface changes.
         These are used as ISP Hop 1 / Hop 2 for latency & loss monitoring.
         """
         try:
             output = subprocess.check_output(
-                ["tracert", "-d", "-h", "5", PUBLIC_PING_HOST],
+                ["tracert", "-d", "-h", "4", "-w", "500", PUBLIC_PING_HOST],
                 encoding="utf-8",
                 errors="ignore",
                 timeout=30,
@@ -171,16 +551,18 @@ class NetworkMonitor(QtCore.QObject):
 
         hops: List[str] = []
         for line in output.splitlines():
-            line = line.strip()
             # Typical line:
             #  1     2 ms     2 ms     2 ms  221.253.69.145
-            parts = line.split()
-            if len(parts) >= 4 and parts[0].isdigit():
-                ip = parts[-1]
-                if ip.count(".") == 3:
-                    hops.append(ip)
+            # Cheap substring check first: banner and timeout lines have no "ms".
+            if "ms" not in line:
+                continue
+            m = _HOP_RE.match(line)
+            if m:
+                hops.append(m.group(2))
+                if len(hops) == 2:
+                    break
 
-        self._isp_hops = hops[:2]
+        self._isp_hops = hops
 
     # ------------------------------------------------------------------ #
     # Ping helper
@@ -200,17 +582,9 @@ class NetworkMonitor(QtCore.QObject):
           - jitter = None
           - loss = 100.0
         """
-        latencies = []
-
-        for _ in range(count):
-            try:
-                r = ping(host, unit="ms", timeout=timeout)
-            except Exception:
-                r = None
-
-            if r is not None:
-                latencies.append(r)
-            time.sleep(0.1)
+        latencies = _icmp_ping(host, count, timeout, self._stop_event)
+        if latencies is None:
+            latencies = _run_os_ping(host, count, timeout)
 
         success = len(latencies)
         loss_pct = round(100.0 * (count - success) / count, 1)
@@ -222,6 +596,34 @@ class NetworkMonitor(QtCore.QObject):
         jitter = round(statistics.pstdev(latencies), 2) if success > 1 else 0.0
         return avg, jitter, loss_pct
 
+    # ------------------------------------------------------------------ #
+    # Local counters
+    # ------------------------------------------------------------------ #
+    def _pernic_counters(self) -> Tuple[dict, float]:
+        """
+        Per-NIC I/O counters plus the monotonic time they were read.
+        The (expensive on Windows) psutil call runs at most once per
+        PERNIC_TTL seconds; callers compute rates from the returned time.
+        """
+        now = time.monotonic()
+        if self._pernic_cache is None or now - self._pernic_time >= PERNIC_TTL:
+            self._pernic_cache = psutil.net_io_counters(pernic=True, nowrap=True)
+            self._pernic_time = now
+        return self._pernic_cache, self._pernic_time
+
+    def _system_usage(self) -> Tuple[float, float]:
+        """
+        (cpu_pct, mem_pct), re-read from psutil only when older than
+        CPU_MIN_INTERVAL / MEM_TTL. cpu_percent(None) measures since the
+        previous call, so calls closer together than that are meaningless.
+        """
+        now = time.monotonic()
+        if now - self._last_cpu[0] >= CPU_MIN_INTERVAL:
+            self._last_cpu = (now, psutil.cpu_percent(interval=None))
+        if now - self._last_mem[0] >= MEM_TTL:
+            self._last_mem = (now, psutil.virtual_memory().percent)
+        return self._last_cpu[1], self._last_mem[1]
+
     # ------------------------------------------------------------------ #
     # Score helpers
     # ------------------------------------------------------------------ #
@@ -322,95 +724,116 @@ class NetworkMonitor(QtCore.QObject):
     # ------------------------------------------------------------------ #
     # Single measurement
     # ------------------------------------------------------------------ #
-    def _take_sample(self) -> dict:
-        timestamp = datetime.now(ZoneInfo("Asia/Tokyo")).strftime("%Y-%m-%d %H:%M:%S")
+    def _take_sample(self) -> Sample:
+        timestamp = datetime.now(_JST).strftime(_TS_FMT)
+
+        # Pings, HTTP, public IP and SNMP are all independent and I/O-bound,
+        # so fan them out concurrently. Probes that don't depend on the
+        # interface go first and run while ipconfig / VPN detection below
+        # block this thread. Three echoes are enough for jitter; the router
+        # is on the LAN, so two will do.
+        # While the internet is down, the Meet / ISP hop / VPN pings would
+        # only sit out their timeouts: after a DOWN sample they wait for the
+        # 8.8.8.8 result and are skipped unless it answers again. Skipped
+        # targets are logged as 100% loss, exactly what the ping would have
+        # returned, so the scores of consecutive DOWN samples stay the same.
+        probe_upstream = self._last_status != "DOWN"
+        pool = self._pool
+        internet_fut = pool.submit(self._ping_host, PUBLIC_PING_HOST, 3, 2.0)
+        meet_fut = pool.submit(self._ping_host, MEET_HOST, 3, 2.0) if probe_upstream else None
+        http_fut = pool.submit(get_http_latency)
+        sw_cpu_fut = pool.submit(get_sonicwall_cpu_load)
+        sw_sessions_fut = pool.submit(get_sonicwall_active_sessions)
+        sw_wan_fut = pool.submit(get_sonicwall_wan_octets)
+
+        # Interface info: the gateway feeds the router and VPN targets
+        iface_info = get_active_interface_info()
+        gateway_ip = iface_info.get("gateway", "")
 
-        # 1. Internet baseline: public ping (8.8.8.8)
-        latency_ms, jitter_ms, packet_loss_pct = self._ping_host(
-            PUBLIC_PING_HOST,
-            count=5,
-            timeout=2.0,
+        # On an interface switch, refresh the public IP now and re-run the
+        # (slow) ISP hop discovery in the background for the next samples
+        iface_changed = iface_info.get("name") != self._last_iface
+        if iface_changed and self._last_iface is not None:
+            self._pool.submit(self._detect_isp_hops)
+        self._last_iface = iface_info.get("name")
+
+        refresh_public_ip = (
+            iface_changed
+            or time.monotonic() - self._public_ip_cache[1] >= PUBLIC_IP_TTL
         )
 
+        isp_hop1_ip = self._isp_hops[0] if len(self._isp_hops) > 0 else ""
+        isp_hop2_ip = self._isp_hops[1] if len(self._isp_hops) > 1 else ""
+
+        vpn_active = is_vpn_active()
+        vpn_target = VPN_TEST_HOST or gateway_ip
+
+        router_fut = pool.submit(self._ping_host, gateway_ip, 2, 1.5) if gateway_ip else None
+        if not probe_upstream:
+            latency_ms, _, packet_loss_pct = internet_fut.result()
+            probe_upstream = not (latency_ms is None and packet_loss_pct >= 99.0)
+            if probe_upstream:
+                meet_fut = pool.submit(self._ping_host, MEET_HOST, 3, 2.0)
+        hop1_fut = hop2_fut = vpn_fut = None
+        if probe_upstream:
+            if isp_hop1_ip:
+                hop1_fut = pool.submit(self._ping_host, isp_hop1_ip, 3, 1.5)
+            if isp_hop2_ip:
+                hop2_fut = pool.submit(self._ping_host, isp_hop2_ip, 3, 1.5)
+            if vpn_active and vpn_target:
+                vpn_fut = pool.submit(self._ping_host, vpn_target, 3, 1.5)
+        public_ip_fut = pool.submit(get_public_ip) if refresh_public_ip else None
+
+        # 1. Internet baseline: public ping (8.8.8.8)
+        latency_ms, jitter_ms, packet_loss_pct = internet_fut.result()
+
         # 2. Router / gateway ping (Wi-Fi / LAN health)
-        iface_info = get_active_interface_info()
-        gateway_ip = iface_info.get("gateway", "")
         router_latency_ms = None
         router_packet_loss_pct = None
-
-        if gateway_ip:
-            r_lat, r_jit, r_loss = self._ping_host(
-                gateway_ip,
-                count=5,
-                timeout=1.5,
-            )
-            router_latency_ms = r_lat
-            router_packet_loss_pct = r_loss
+        if router_fut:
+            router_latency_ms, _, router_packet_loss_pct = router_fut.result()
 
         # 3. ISP Hop 1 / Hop 2 (from tracert)
-        isp_hop1_ip = self._isp_hops[0] if len(self._isp_hops) > 0 else ""
-        isp_hop2_ip = self._isp_hops[1] if len(self._isp_hops) > 1 else ""
-
         isp_hop1_latency_ms = None
         isp_hop1_loss_pct = None
         isp_hop2_latency_ms = None
         isp_hop2_loss_pct = None
-
-        if isp_hop1_ip:
-            h1_lat, h1_jit, h1_loss = self._ping_host(
-                isp_hop1_ip,
-                count=3,
-                timeout=1.5,
-            )
-            isp_hop1_latency_ms = h1_lat
-            isp_hop1_loss_pct = h1_loss
-
-        if isp_hop2_ip:
-            h2_lat, h2_jit, h2_loss = self._ping_host(
-                isp_hop2_ip,
-                count=3,
-                timeout=1.5,
-            )
-            isp_hop2_latency_ms = h2_lat
-            isp_hop2_loss_pct = h2_loss
+        if hop1_fut:
+            isp_hop1_latency_ms, _, isp_hop1_loss_pct = hop1_fut.result()
+        elif isp_hop1_ip and not probe_upstream:
+            isp_hop1_loss_pct = 100.0
+        if hop2_fut:
+            isp_hop2_latency_ms, _, isp_hop2_loss_pct = hop2_fut.result()
+        elif isp_hop2_ip and not probe_upstream:
+            isp_hop2_loss_pct = 100.0
 
         # 4. Google Meet ping (platform edge / upstream ISP)
         meet_latency_ms = None
         meet_packet_loss_pct = None
-        try:
-            m_lat, m_jit, m_loss = self._ping_host(
-                MEET_HOST,
-                count=5,
-                timeout=2.0,
-            )
-            meet_latency_ms = m_lat
-            meet_packet_loss_pct = m_loss
-        except Exception:
-            meet_latency_ms = None
-            meet_packet_loss_pct = None
+        if meet_fut:
+            try:
+                meet_latency_ms, _, meet_packet_loss_pct = meet_fut.result()
+            except Exception:
+                pass
+        elif not probe_upstream:
+            meet_packet_loss_pct = 100.0
 
         # 5. HTTP latency
-        http_latency_ms = get_http_latency()
+        http_latency_ms = _result_or_none(http_fut)
+        if http_latency_ms is not None:
+            http_latency_ms = round(http_latency_ms, 2)  # for the log only
 
         # 6. VPN and SonicWall CPU (if applicable)
-        vpn_active = is_vpn_active()
         vpn_latency_ms = None
         vpn_packet_loss_pct = None
+        if vpn_fut:
+            vpn_latency_ms, _, vpn_packet_loss_pct = vpn_fut.result()
+        elif vpn_active and vpn_target and not probe_upstream:
+            vpn_packet_loss_pct = 100.0
 
-        vpn_target = VPN_TEST_HOST or gateway_ip
-
-        if vpn_active and vpn_target:
-            v_lat, v_jit, v_loss = self._ping_host(
-                vpn_target,
-                count=5,
-                timeout=1.5,
-            )
-            vpn_latency_ms = v_lat
-            vpn_packet_loss_pct = v_loss
-
-        sonicwall_cpu_pct = get_sonicwall_cpu_load()
-        sonicwall_sessions = get_sonicwall_active_sessions()
-        sonicwall_wan = get_sonicwall_wan_octets()
+        sonicwall_cpu_pct = _result_or_none(sw_cpu_fut)
+        sonicwall_sessions = _result_or_none(sw_sessions_fut)
+        sonicwall_wan = _result_or_none(sw_wan_fut)
 
         # 7. Speedtest (background thread every 5 intervals)
         download_mbps = ""
@@ -434,23 +857,30 @@ class NetworkMonitor(QtCore.QObject):
 
         # 8. Interface info + Wi-Fi "signal"
         local_ip = iface_info.get("ip_address", "")
-        dns = ";".join(iface_info.get("dns_servers", []))
+        dns_key = tuple(iface_info.get("dns_servers", ()))
+        if dns_key != self._last_dns[0]:
+            self._last_dns = (dns_key, ";".join(dns_key))
+        dns = self._last_dns[1]
         signal_strength = iface_info.get("signal_strength", "")
         iface_name = iface_info.get("name", "")
 
         # 9. Public IP
-        public_ip = get_public_ip()
+        public_ip = self._public_ip_cache[0]
+        if public_ip_fut:
+            fetched_ip = _result_or_none(public_ip_fut)
+            if fetched_ip:
+                public_ip = fetched_ip
+                self._public_ip_cache = (fetched_ip, time.monotonic())
 
         # 10. Local PC metrics (CPU, Memory)
-        cpu_pct = psutil.cpu_percent(interval=None)
-        mem_pct = psutil.virtual_memory().percent
+        cpu_pct, mem_pct = self._system_usage()
 
         # 11. Local NIC throughput (Mbps)
         nic_up_mbps = ""
         nic_down_mbps = ""
         if iface_name:
-            counters = psutil.net_io_counters(pernic=True).get(iface_name)
-            now_t = time.time()
+            pernic, now_t = self._pernic_counters()
+            counters = pernic.get(iface_name)
             if counters and self._last_nic_counters and self._last_nic_time:
                 dt = now_t - self._last_nic_time
                 if dt > 0:
@@ -504,64 +934,64 @@ class NetworkMonitor(QtCore.QObject):
             internet_loss=packet_loss_pct,
         )
 
-        sample = {
-            "timestamp": timestamp,
+        sample = Sample(
+            timestamp=timestamp,
 
             # Internet (8.8.8.8)
-            "latency_ms": latency_ms if latency_ms is not None else "",
-            "jitter_ms": jitter_ms if jitter_ms is not None else "",
-            "packet_loss_pct": packet_loss_pct if packet_loss_pct is not None else "",
-            "http_latency_ms": http_latency_ms if http_latency_ms is not None else "",
+            latency_ms=_blank_if_none(latency_ms),
+            jitter_ms=_blank_if_none(jitter_ms),
+            packet_loss_pct=_blank_if_none(packet_loss_pct),
+            http_latency_ms=_blank_if_none(http_latency_ms),
 
             # Router
-            "router_latency_ms": router_latency_ms if router_latency_ms is not None else "",
-            "router_packet_loss_pct": router_packet_loss_pct if router_packet_loss_pct is not None else "",
+            router_latency_ms=_blank_if_none(router_latency_ms),
+            router_packet_loss_pct=_blank_if_none(router_packet_loss_pct),
 
             # ISP Hops
-            "isp_hop1_ip": isp_hop1_ip,
-            "isp_hop1_latency_ms": isp_hop1_latency_ms if isp_hop1_latency_ms is not None else "",
-            "isp_hop1_loss_pct": isp_hop1_loss_pct if isp_hop1_loss_pct is not None else "",
-            "isp_hop2_ip": isp_hop2_ip,
-            "isp_hop2_latency_ms": isp_hop2_latency_ms if isp_hop2_latency_ms is not None else "",
-            "isp_hop2_loss_pct": isp_hop2_loss_pct if isp_hop2_loss_pct is not None else "",
+            isp_hop1_ip=isp_hop1_ip,
+            isp_hop1_latency_ms=_blank_if_none(isp_hop1_latency_ms),
+            isp_hop1_loss_pct=_blank_if_none(isp_hop1_loss_pct),
+            isp_hop2_ip=isp_hop2_ip,
+            isp_hop2_latency_ms=_blank_if_none(isp_hop2_latency_ms),
+            isp_hop2_loss_pct=_blank_if_none(isp_hop2_loss_pct),
 
             # Google Meet
-            "meet_latency_ms": meet_latency_ms if meet_latency_ms is not None else "",
-            "meet_packet_loss_pct": meet_packet_loss_pct if meet_packet_loss_pct is not None else "",
+            meet_latency_ms=_blank_if_none(meet_latency_ms),
+            meet_packet_loss_pct=_blank_if_none(meet_packet_loss_pct),
 
             # VPN
-            "vpn_active": int(vpn_active),  # 1 or 0
-            "vpn_latency_ms": vpn_latency_ms if vpn_latency_ms is not None else "",
-            "vpn_packet_loss_pct": vpn_packet_loss_pct if vpn_packet_loss_pct is not None else "",
+            vpn_active=1 if vpn_active else 0,
+            vpn_latency_ms=_blank_if_none(vpn_latency_ms),
+            vpn_packet_loss_pct=_blank_if_none(vpn_packet_loss_pct),
 
             # SonicWall
-            "sonicwall_cpu_pct": sonicwall_cpu_pct if sonicwall_cpu_pct is not None else "",
-            "sonicwall_sessions": sonicwall_sessions if sonicwall_sessions is not None else "",
-            "sonicwall_wan_in_mbps": sonicwall_wan_in_mbps,
-            "sonicwall_wan_out_mbps": sonicwall_wan_out_mbps,
+            sonicwall_cpu_pct=_blank_if_none(sonicwall_cpu_pct),
+            sonicwall_sessions=_blank_if_none(sonicwall_sessions),
+            sonicwall_wan_in_mbps=sonicwall_wan_in_mbps,
+            sonicwall_wan_out_mbps=sonicwall_wan_out_mbps,
 
             # Speedtest
-            "download_mbps": download_mbps,
-            "upload_mbps": upload_mbps,
+            download_mbps=download_mbps,
+            upload_mbps=upload_mbps,
 
             # Local machine
-            "signal_strength": signal_strength,
-            "local_ip": local_ip,
-            "gateway": gateway_ip,
-            "dns": dns,
-            "public_ip": public_ip,
-            "iface_name": iface_name,
-            "cpu_pct": cpu_pct,
-            "mem_pct": mem_pct,
-            "nic_up_mbps": nic_up_mbps,
-            "nic_down_mbps": nic_down_mbps,
+            signal_strength=signal_strength,
+            local_ip=local_ip,
+            gateway=gateway_ip,
+            dns=dns,
+            public_ip=public_ip,
+            iface_name=iface_name,
+            cpu_pct=cpu_pct,
+            mem_pct=mem_pct,
+            nic_up_mbps=nic_up_mbps,
+            nic_down_mbps=nic_down_mbps,
 
             # Scores
-            "stability_score": stability_score,
-            "meeting_quality_score": meeting_quality_score,
+            stability_score=stability_score,
+            meeting_quality_score=meeting_quality_score,
 
-            "status": status,
-        }
+            status=status,
+        )
 
         return sample
 
@@ -572,16 +1002,26 @@ class NetworkMonitor(QtCore.QObject):
         self._speedtest_running = True
         try:
             try:
-                st = Speedtest()
-                st.get_best_server()
-                download = st.download()
-                upload = st.upload()
+                # Reuse the client and its best server; re-select hourly
+                now = time.monotonic()
+                if self._speedtest is None or now - self._speedtest_best_ts > SPEEDTEST_SERVER_TTL:
+                    if self._speedtest is not None:
+                        self._speedtest.close()
+                    st = Speedtest(cache_path=SPEEDTEST_CACHE_PATH)
+                    st.get_best_server()
+                    self._speedtest = st
+                    self._speedtest_best_ts = now
+                download = self._speedtest.download()
+                upload = self._speedtest.upload()
                 self._speedtest_result = {
                     "download": round(download / 1_000_000, 2),
                     "upload": round(upload / 1_000_000, 2),
                 }
             except Exception:
-                # fully silent if speedtest fails
+                # fully silent if speedtest fails; start fresh next time
+                if self._speedtest is not None:
+                    self._speedtest.close()
+                self._speedtest = None
                 self._speedtest_result = {"download": "", "upload": ""}
         finally:
             self._speedtest_running = False
@@ -589,94 +1029,38 @@ class NetworkMonitor(QtCore.QObject):
     # ------------------------------------------------------------------ #
     # Logging
     # ------------------------------------------------------------------ #
-    def _append_to_log(self, sample: dict):
+    def _open_log(self):
+        """
+        Open log.txt once for appending (writing the header for a new file).
+        The handle stays open for the life of the monitor thread.
+        """
         os.makedirs(os.path.dirname(LOG_FILE_PATH), exist_ok=True)
-        file_exists = os.path.isfile(LOG_FILE_PATH)
-
-        with open(LOG_FILE_PATH, mode="a", encoding="utf-8", newline="") as f:
-            writer = csv.writer(f)
-
-            if not file_exists:
-                writer.writerow(
-                    [
-                        "timestamp",
-                        "latency_ms",
-                        "jitter_ms",
-                        "packet_loss_pct",
-                        "http_latency_ms",
-                        "router_latency_ms",
-                        "router_packet_loss_pct",
-                        "isp_hop1_ip",
-                        "isp_hop1_latency_ms",
-                        "isp_hop1_loss_pct",
-                        "isp_hop2_ip",
-                        "isp_hop2_latency_ms",
-                        "isp_hop2_loss_pct",
-                        "meet_latency_ms",
-                        "meet_packet_loss_pct",
-                        "vpn_active",
-                        "vpn_latency_ms",
-                        "vpn_packet_loss_pct",
-                        "sonicwall_cpu_pct",
-                        "sonicwall_sessions",
-                        "sonicwall_wan_in_mbps",
-                        "sonicwall_wan_out_mbps",
-                        "download_mbps",
-                        "upload_mbps",
-                        "signal_strength",
-                        "local_ip",
-                        "gateway",
-                        "dns",
-                        "public_ip",
-                        "iface_name",
-                        "cpu_pct",
-                        "mem_pct",
-                        "nic_up_mbps",
-                        "nic_down_mbps",
-                        "stability_score",
-                        "meeting_quality_score",
-                        "status",
-                    ]
-                )
-
-            writer.writerow(
-                [
-                    sample["timestamp"],
-                    sample["latency_ms"],
-                    sample["jitter_ms"],
-                    sample["packet_loss_pct"],
-                    sample["http_latency_ms"],
-                    sample["router_latency_ms"],
-                    sample["router_packet_loss_pct"],
-                    sample["isp_hop1_ip"],
-                    sample["isp_hop1_latency_ms"],
-                    sample["isp_hop1_loss_pct"],
-                    sample["isp_hop2_ip"],
-                    sample["isp_hop2_latency_ms"],
-                    sample["isp_hop2_loss_pct"],
-                    sample["meet_latency_ms"],
-                    sample["meet_packet_loss_pct"],
-                    sample["vpn_active"],
-                    sample["vpn_latency_ms"],
-                    sample["vpn_packet_loss_pct"],
-                    sample["sonicwall_cpu_pct"],
-                    sample["sonicwall_sessions"],
-                    sample["sonicwall_wan_in_mbps"],
-                    sample["sonicwall_wan_out_mbps"],
-                    sample["download_mbps"],
-                    sample["upload_mbps"],
-                    sample["signal_strength"],
-                    sample["local_ip"],
-                    sample["gateway"],
-                    sample["dns"],
-                    sample["public_ip"],
-                    sample["iface_name"],
-                    sample["cpu_pct"],
-                    sample["mem_pct"],
-                    sample["nic_up_mbps"],
-                    sample["nic_down_mbps"],
-                    sample["stability_score"],
-                    sample["meeting_quality_score"],
-                    sample["status"],
-                ]
-            )
+        file_exists = os.path.isfile(LOG_FILE_PATH) and os.path.getsize(LOG_FILE_PATH) > 0
+
+        self._log_fh = open(LOG_FILE_PATH, mode="a", encoding="utf-8", newline="")
+        self._log_writer = csv.writer(self._log_fh)
+        self._log_last_flush = 0.0
+
+        if not file_exists:
+            self._log_writer.writerow(_CSV_KEYS)
+            self._log_fh.flush()
+
+    def _close_log(self):
+        if self._log_fh is not None:
+            try:
+                self._log_fh.close()
+            finally:
+                self._log_fh = None
+                self._log_writer = None
+
+    def _append_to_log(self, sample: Sample):
+        with self._log_lock:
+            if self._log_fh is None:
+                self._open_log()
+
+            self._log_writer.writerow(_sample_row(sample))
+
+            now = time.monotonic()
+            if now - self._log_last_flush >= LOG_FLUSH_MIN_SECONDS:
+                self._log_fh.flush()
+                self._log_last_flush = now
@@ -9,23 +9,49 @@ Only the Speedtest class and supporting code remain.
 """
 
 import math
+import os
+import pickle
 import platform
 import re
 import socket
 import sys
 import threading
+import time
 import timeit
 import xml.parsers.expat
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from urllib.request import (
-    urlopen, Request, HTTPError, URLError,
+    build_opener, HTTPHandler, HTTPSHandler, Request, HTTPError, URLError,
 )
 from urllib.parse import urlparse, parse_qs
-from http.client import HTTPConnection, HTTPSConnection, BadStatusLine
+from http.client import HTTPConnection, HTTPSConnection, HTTPException, BadStatusLine
 from io import BytesIO
 import gzip
+from typing import NamedTuple
+
+import numpy as np
 
 __version__ = "2.1.4-GUI"
 
+# Read size for the streamed download test
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Concurrent transfers in the download/upload tests; one TCP stream cannot
+# fill a high bandwidth-delay link. One image size per download stream; four
+# 2000x2000 images add up to about the single 4000x4000 image used before.
+DOWNLOAD_SIZES = (2000, 2000, 2000, 2000)
+UPLOAD_THREADS = 4
+UPLOAD_SIZE = 1048576  # bytes per upload stream
+
+# Upload body, allocated once and sent from a memoryview (no per-call copy)
+_UPLOAD_PAYLOAD = bytes(UPLOAD_SIZE)
+
+# Age (seconds) after which an on-disk server list cache is refetched
+SERVER_CACHE_TTL = 6 * 3600
+
+# Read size for the streamed server-list parse
+SERVERS_CHUNK_SIZE = 64 * 1024
+
 # -----------------------------
 # Utility stubs (no console UI)
 # -----------------------------
@@ -62,6 +88,60 @@ class NoMatchedServers(SpeedtestException):
 # HTTP Utilities
 # -----------------------------
 
+# Pre-resolved addresses of the selected test server: {(host, port): addrinfo}
+_PINNED_ADDRS = {}
+
+def _tuned_create_connection(address, timeout=socket._GLOBAL_DEFAULT_TIMEOUT,
+                              source_address=None, *args, **kwargs):
+    """
+    socket.create_connection with TCP_NODELAY (no Nagle stall on the small
+    latency requests). Buffer sizes are left to the OS: setting SO_RCVBUF /
+    SO_SNDBUF turns off receive-window auto-tuning, which would cap the
+    window on fast links. Pinned hosts skip the DNS lookup.
+    """
+    host, port = address
+    infos = _PINNED_ADDRS.get((host, port))
+    if infos is None:
+        infos = socket.getaddrinfo(host, port, 0, socket.SOCK_STREAM)
+    err = None
+    for family, type_, proto, _, sa in infos:
+        sock = None
+        try:
+            sock = socket.socket(family, type_, proto)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            if timeout is not socket._GLOBAL_DEFAULT_TIMEOUT:
+                sock.settimeout(timeout)
+            if source_address:
+                sock.bind(source_address)
+            sock.connect(sa)
+            return sock
+        except OSError as e:
+            err = e
+            if sock is not None:
+                sock.close()
+    raise err if err is not None else OSError(f"getaddrinfo returned nothing for {host}")
+
+class TunedHTTPConnection(HTTPConnection):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._create_connection = _tuned_create_connection
+
+class TunedHTTPSConnection(HTTPSConnection):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._create_connection = _tuned_create_connection
+
+class _TunedHTTPHandler(HTTPHandler):
+    def http_open(self, req):
+        return self.do_open(TunedHTTPConnection, req)
+
+class _TunedHTTPSHandler(HTTPSHandler):
+    def https_open(self, req):
+        return self.do_open(TunedHTTPSConnection, req, context=self._context)
+
+# urllib opener whose connections use the tuned sockets
+_OPENER = build_opener(_TunedHTTPHandler, _TunedHTTPSHandler)
+
 def build_user_agent():
     ua = (
         f"Mozilla/5.0 (Python {platform.python_version()}) "
@@ -77,7 +157,7 @@ def build_request(url, data=None, headers=None):
 
 def catch_request(request):
     try:
-        return urlopen(request), None
+        return _OPENER.open(request), None
     except (HTTPError, URLError, socket.error, BadStatusLine) as e:
         return None, e
 
@@ -107,19 +187,47 @@ def distance(a, b):
         * math.cos(math.radians(lat2))
         * math.sin(dlon / 2) ** 2
     )
-    c = 2 * math.atan2(math.sqrt(aa), math.sqrt(1 - aa))
+    c = 2 * math.asin(math.sqrt(min(aa, 1.0)))
+    return radius * c
+
+def distances(origin, lats, lons):
+    """
+    Vectorised `distance` from `origin` to every (lats[i], lons[i]), in km.
+    """
+    lat1, lon1 = origin
+    radius = 6371
+    lats = np.radians(lats)
+    dlat = lats - math.radians(lat1)
+    dlon = np.radians(lons) - math.radians(lon1)
+    aa = (
+        np.sin(dlat / 2) ** 2 +
+        math.cos(math.radians(lat1))
+        * np.cos(lats)
+        * np.sin(dlon / 2) ** 2
+    )
+    c = 2 * np.arcsin(np.sqrt(np.minimum(aa, 1.0)))
     return radius * c
 
 # -----------------------------
 # Results container
 # -----------------------------
 
+class ServerInfo(NamedTuple):
+    url: str
+    lat: float
+    lon: float
+    name: str
+    country: str
+    sponsor: str
+    id: str
+    d: float  # distance from the client, km
+
 class SpeedtestResults:
     def __init__(self):
         self.download = 0
         self.upload = 0
         self.ping = 0
-        self.server = {}
+        self.server = None  # ServerInfo once selected
         self.bytes_sent = 0
         self.bytes_received = 0
 
@@ -128,15 +236,130 @@ class SpeedtestResults:
 # -----------------------------
 
 class Speedtest:
-    def __init__(self, timeout=10, secure=False):
+    def __init__(self, timeout=10, secure=False, cache_path=None):
         self.timeout = timeout
         self.secure = secure
-        self._opener = urlopen
-        self.servers = {}
+        # Optional pickle of (lat_lon, servers, distances) reused across runs
+        self.cache_path = cache_path
+        self._opener = _OPENER.open
+        # Server list as parallel arrays: ServerInfo entries and their distances (km)
+        self.servers = []
+        self._srv_dist = np.empty(0)
         self.closest = []
         self.results = SpeedtestResults()
+        # Kept-alive connections by (scheme, host:port)
+        self._conns = {}
+        self._conns_lock = threading.Lock()
+        # (host, port) keys this client added to _PINNED_ADDRS
+        self._pinned = []
+
+        if not self._load_cache():
+            self.get_config()
+
+    def close(self):
+        for conn in self._conns.values():
+            conn.close()
+        self._conns.clear()
+        for key in self._pinned:
+            _PINNED_ADDRS.pop(key, None)
+        self._pinned.clear()
+
+    def _pin_server(self, url):
+        """
+        Resolve the test server's host once so the download/upload requests
+        don't repeat the DNS lookup. TLS still sees the hostname.
+        """
+        parsed = urlparse(url)
+        port = parsed.port or (443 if parsed.scheme == "https" else 80)
+        key = (parsed.hostname, port)
+        try:
+            _PINNED_ADDRS[key] = socket.getaddrinfo(key[0], port, 0, socket.SOCK_STREAM)
+        except OSError:
+            return
+        self._pinned.append(key)
+
+    # -------------------------
+    # Server list cache
+    # -------------------------
 
-        self.get_config()
+    def _load_cache(self):
+        """
+        Restore lat_lon and the server list from cache_path if it is younger
+        than SERVER_CACHE_TTL. Returns True if config/servers were loaded.
+        """
+        if not self.cache_path:
+            return False
+        try:
+            if time.time() - os.path.getmtime(self.cache_path) >= SERVER_CACHE_TTL:
+                return False
+            with open(self.cache_path, "rb") as f:
+                lat_lon, servers, dists = pickle.load(f)
+        except Exception:
+            return False
+        if not servers or len(servers) != len(dists) or not isinstance(servers[0], ServerInfo):
+            return False
+        self.lat_lon = lat_lon
+        self.servers = servers
+        self._srv_dist = dists
+        return True
+
+    def _save_cache(self):
+        if not self.cache_path:
+            return
+        tmp = self.cache_path + ".tmp"
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.cache_path)), exist_ok=True)
+            with open(tmp, "wb") as f:
+                pickle.dump((self.lat_lon, self.servers, self._srv_dist), f,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, self.cache_path)
+        except OSError:
+            pass
+
+    # -------------------------
+    # Keep-alive requests
+    # -------------------------
+
+    def _connection(self, parsed):
+        key = (parsed.scheme, parsed.netloc)
+        with self._conns_lock:
+            conn = self._conns.get(key)
+            if conn is None:
+                conn_cls = TunedHTTPSConnection if parsed.scheme == "https" else TunedHTTPConnection
+                conn = conn_cls(parsed.netloc, timeout=self.timeout)
+                self._conns[key] = conn
+        return conn
+
+    def _timed_get(self, url):
+        """
+        GET `url` over the kept-alive connection to its host and return the
+        request/response time in ms. Connecting (TCP + TLS) happens before
+        the timer starts, and only once per host.
+        """
+        parsed = urlparse(url)
+        path = parsed.path or "/"
+        if parsed.query:
+            path += "?" + parsed.query
+        headers = {"User-Agent": build_user_agent(), "Connection": "keep-alive"}
+
+        conn = self._connection(parsed)
+        try:
+            if conn.sock is None:
+                conn.connect()
+            start = timeit.default_timer()
+            conn.request("GET", path, headers=headers)
+            resp = conn.getresponse()
+            resp.read()
+            elapsed = (timeit.default_timer() - start) * 1000
+        except (HTTPException, OSError):
+            conn.close()  # reconnects on next use
+            raise
+
+        if resp.will_close:
+            conn.close()
+        if resp.status != 200:
+            raise HTTPException(f"HTTP {resp.status} for {url}")
+        return elapsed
 
     # -------------------------
     # Config
@@ -166,108 +389,196 @@ class Speedtest:
     # Servers
     # -------------------------
 
+    def _fetch_servers(self, url):
+        """
+        Download and parse a server list, feeding the response to expat in
+        chunks as it arrives. Returns (fields, lats, lons): per server the
+        (url, name, country, sponsor, id) strings, plus the coordinates as
+        float64 arrays.
+        """
+        req = build_request(url)
+        resp, err = catch_request(req)
+        if err:
+            raise err
+
+        entries = []
+        lats = []
+        lons = []
+
+        def start_element(name, attrs):
+            if name != "server":
+                return
+            try:
+                entry = (
+                    attrs["url"], attrs["name"], attrs["country"],
+                    attrs["sponsor"], attrs["id"],
+                )
+                lat, lon = attrs["lat"], attrs["lon"]
+            except KeyError:
+                return
+            entries.append(entry)
+            lats.append(lat)
+            lons.append(lon)
+
+        parser = xml.parsers.expat.ParserCreate()
+        parser.StartElementHandler = start_element
+        try:
+            stream = get_response_stream(resp)
+            while chunk := stream.read(SERVERS_CHUNK_SIZE):
+                parser.Parse(chunk, False)
+            parser.Parse(b"", True)
+        finally:
+            resp.close()
+
+        # Coordinates are converted in bulk; only a list with a malformed
+        # value falls back to per-entry parsing (dropping those entries)
+        try:
+            return (
+                entries,
+                np.array(lats).astype(np.float64),
+                np.array(lons).astype(np.float64),
+            )
+        except ValueError:
+            keep = []
+            for i, (lat, lon) in enumerate(zip(lats, lons)):
+                try:
+                    float(lat), float(lon)
+                except ValueError:
+                    continue
+                keep.append(i)
+            return (
+                [entries[i] for i in keep],
+                np.array([lats[i] for i in keep]).astype(np.float64),
+                np.array([lons[i] for i in keep]).astype(np.float64),
+            )
+
     def get_servers(self):
         urls = [
             "https://www.speedtest.net/speedtest-servers-static.php",
             "http://c.speedtest.net/speedtest-servers-static.php",
         ]
 
+        # Race the mirrors and keep whichever answers first
         errors = []
-        for url in urls:
-            req = build_request(url)
-            resp, err = catch_request(req)
-            if err:
-                errors.append(err)
-                continue
-
-            stream = get_response_stream(resp)
-            xml_data = stream.read()
-            resp.close()
-
-            # Parse manually (simple)
-            servers = re.findall(
-                rb'<server url="([^"]+)" lat="([^"]+)" lon="([^"]+)" name="([^"]+)" '
-                rb'country="([^"]+)" cc="([^"]+)" sponsor="([^"]+)" id="([^"]+)"',
-                xml_data
-            )
-
-            for (urlb, latb, lonb, name, country, cc, sponsor, sid) in servers:
+        pool = ThreadPoolExecutor(max_workers=len(urls))
+        try:
+            futures = [pool.submit(self._fetch_servers, url) for url in urls]
+            parsed = None
+            for fut in as_completed(futures):
                 try:
-                    lat = float(latb)
-                    lon = float(lonb)
-                    dist = distance(self.lat_lon, (lat, lon))
-                    entry = {
-                        "url": urlb.decode(),
-                        "lat": lat,
-                        "lon": lon,
-                        "name": name.decode(),
-                        "country": country.decode(),
-                        "sponsor": sponsor.decode(),
-                        "id": sid.decode(),
-                        "d": dist,
-                    }
-                    self.servers.setdefault(dist, []).append(entry)
-                except:
-                    continue
-
-            return self.servers
+                    parsed = fut.result()
+                    break
+                except Exception as e:
+                    errors.append(e)
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+        if parsed is None:
+            raise ServersRetrievalError(errors)
+        entries, lats, lons = parsed
+
+        # All distances in one pass
+        dists = distances(self.lat_lon, lats, lons)
+        servers = [
+            ServerInfo(url, lat, lon, name, country, sponsor, sid, dist)
+            for (url, name, country, sponsor, sid), lat, lon, dist
+            in zip(entries, lats.tolist(), lons.tolist(), dists.tolist())
+        ]
 
-        raise ServersRetrievalError(errors)
+        self.servers = servers
+        self._srv_dist = dists
+        if servers:
+            self._save_cache()
+        return self.servers
 
     def get_closest_servers(self):
         if not self.servers:
             self.get_servers()
 
-        for d in sorted(self.servers.keys()):
-            for s in self.servers[d]:
-                self.closest.append(s)
-                if len(self.closest) >= 5:
-                    return self.closest
+        # Top 5 by distance without sorting the whole list
+        k = min(5, len(self._srv_dist))
+        if k == 0:
+            return self.closest
+        idx = np.argpartition(self._srv_dist, k - 1)[:k]
+        idx = idx[np.argsort(self._srv_dist[idx])]
+        self.closest = [self.servers[i] for i in idx]
         return self.closest
 
     def get_best_server(self):
         if not self.closest:
             self.get_closest_servers()
 
+        # Probe all candidates at once: selection takes the slowest RTT,
+        # not the sum of them
+        def probe(s):
+            url = s.url.rsplit("/", 1)[0] + "/latency.txt"
+            return self._timed_get(url), s
+
         results = {}
-        for s in self.closest:
-            url = s["url"].rsplit("/", 1)[0] + "/latency.txt"
-            req = build_request(url)
-            start = timeit.default_timer()
-            resp, err = catch_request(req)
-            if err:
-                continue
-            resp.read()
-            t = (timeit.default_timer() - start) * 1000
-            results[t] = s
+        with ThreadPoolExecutor(max_workers=len(self.closest) or 1) as pool:
+            futures = [pool.submit(probe, s) for s in self.closest]
+            for fut in as_completed(futures):
+                try:
+                    t, s = fut.result()
+                except (HTTPException, OSError):
+                    continue
+                results[t] = s
 
         if not results:
             raise SpeedtestBestServerFailure("Could not find best server")
 
-        best_latency = sorted(results.keys())[0]
+        best_latency = min(results)
         best = results[best_latency]
-        best["latency"] = best_latency
         self.results.ping = best_latency
         self.results.server = best
+        self._pin_server(best.url)
         return best
 
     # -------------------------
     # Download
     # -------------------------
 
-    def download(self):
-        srv = self.get_best_server()
-        base = srv["url"].rsplit("/", 1)[0]
-        url = base + "/random4000x4000.jpg"
-
-        req = build_request(url)
-        start = timeit.default_timer()
-        resp, err = catch_request(req)
+    def _download_one(self, url):
+        """
+        Stream one file into a reusable buffer and return
+        (bytes, first_byte_time, end_time), or None on failure.
+        The first chunk only starts the clock and is not counted, so server
+        think time is not taken as transfer.
+        """
+        resp, err = catch_request(build_request(url))
         if err:
+            return None
+
+        buf = memoryview(bytearray(DOWNLOAD_CHUNK_SIZE))
+        total = 0
+        with resp:
+            if not resp.readinto(buf):
+                return None
+            start = timeit.default_timer()
+            while True:
+                n = resp.readinto(buf)
+                if not n:
+                    break
+                total += n
+            end = timeit.default_timer()
+        return total, start, end
+
+    def download(self):
+        srv = self.results.server or self.get_best_server()
+        base = srv.url.rsplit("/", 1)[0]
+        urls = [f"{base}/random{size}x{size}.jpg" for size in DOWNLOAD_SIZES]
+
+        # One stream per image on its own connection; throughput is the sum
+        # of bytes over the span from the first first-byte to the last end
+        with ThreadPoolExecutor(max_workers=len(urls)) as pool:
+            parts = [p for p in pool.map(self._download_one, urls) if p]
+        if not parts:
             return 0
 
-        total = len(resp.read())
-        duration = timeit.default_timer() - start
+        total = sum(p[0] for p in parts)
+        duration = max(p[2] for p in parts) - min(p[1] for p in parts)
+        if not total or duration <= 0:
+            return 0
 
         self.results.bytes_received = total
         self.results.download = (total * 8) / duration  # bits/sec
@@ -279,20 +590,39 @@ class Speedtest:
 
     def upload(self):
         srv = self.results.server or self.get_best_server()
-        url = srv["url"]
-
-        data = b"x" * 1048576  # 1 MB
-        req = build_request(url, data=data)
+        parsed = urlparse(srv.url)
+        path = parsed.path or "/"
+        conn_cls = TunedHTTPSConnection if parsed.scheme == "https" else TunedHTTPConnection
+        headers = {
+            "User-Agent": build_user_agent(),
+            "Content-Type": "application/x-www-form-urlencoded",
+            "Content-Length": str(len(_UPLOAD_PAYLOAD)),
+        }
+        body = memoryview(_UPLOAD_PAYLOAD)
+
+        # One connection per stream; http.client sends a memoryview body
+        # straight to the socket
+        def post(_):
+            conn = conn_cls(parsed.netloc, timeout=self.timeout)
+            try:
+                conn.request("POST", path, body=body, headers=headers)
+                resp = conn.getresponse()
+                resp.read()
+                if resp.status != 200:
+                    return 0
+            except Exception:
+                return 0
+            finally:
+                conn.close()
+            return len(body)
 
         start = timeit.default_timer()
-        try:
-            resp = urlopen(req)
-            resp.read()
-        except:
-            return 0
-
+        with ThreadPoolExecutor(max_workers=UPLOAD_THREADS) as pool:
+            sent = sum(pool.map(post, range(UPLOAD_THREADS)))
         duration = timeit.default_timer() - start
+        if not sent:
+            return 0
 
-        self.results.bytes_sent = len(data)
-        self.results.upload = (len(data) * 8) / duration
+        self.results.bytes_sent = sent
+        self.results.upload = (sent * 8) / duration
         return self.results.upload
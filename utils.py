@@ -14,9 +14,11 @@ import platform
 import subprocess
 import re
 import socket
-from typing import Dict, List, Optional
-from urllib.request import urlopen
-from urllib.error import URLError
+import threading
+import time
+from http.client import HTTPConnection, HTTPSConnection, HTTPException
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
 
 import psutil
 
@@ -28,12 +30,130 @@ if platform.system() == "Windows":
     HIDE_WINDOW = subprocess.STARTUPINFO()
     HIDE_WINDOW.dwFlags |= subprocess.STARTF_USESHOWWINDOW
 
+# --- Windows IP Helper API (adapter gateways / DNS without ipconfig) ---
+_HAS_ADAPTERS_API = False
+if platform.system() == "Windows":
+    try:
+        import ctypes
+
+        class _SOCKET_ADDRESS(ctypes.Structure):
+            _fields_ = [
+                ("lpSockaddr", ctypes.c_void_p),
+                ("iSockaddrLength", ctypes.c_int),
+            ]
+
+        class _IP_ADAPTER_ADDR_ENTRY(ctypes.Structure):
+            # Common head of the unicast / DNS server / gateway entries
+            pass
+
+        _IP_ADAPTER_ADDR_ENTRY._fields_ = [
+            ("Alignment", ctypes.c_ulonglong),
+            ("Next", ctypes.POINTER(_IP_ADAPTER_ADDR_ENTRY)),
+            ("Address", _SOCKET_ADDRESS),
+        ]
+
+        class _IP_ADAPTER_ADDRESSES(ctypes.Structure):
+            # Only the fields up to FirstGatewayAddress are declared
+            pass
+
+        _IP_ADAPTER_ADDRESSES._fields_ = [
+            ("Alignment", ctypes.c_ulonglong),
+            ("Next", ctypes.POINTER(_IP_ADAPTER_ADDRESSES)),
+            ("AdapterName", ctypes.c_char_p),
+            ("FirstUnicastAddress", ctypes.POINTER(_IP_ADAPTER_ADDR_ENTRY)),
+            ("FirstAnycastAddress", ctypes.c_void_p),
+            ("FirstMulticastAddress", ctypes.c_void_p),
+            ("FirstDnsServerAddress", ctypes.POINTER(_IP_ADAPTER_ADDR_ENTRY)),
+            ("DnsSuffix", ctypes.c_wchar_p),
+            ("Description", ctypes.c_wchar_p),
+            ("FriendlyName", ctypes.c_wchar_p),
+            ("PhysicalAddress", ctypes.c_ubyte * 8),
+            ("PhysicalAddressLength", ctypes.c_ulong),
+            ("Flags", ctypes.c_ulong),
+            ("Mtu", ctypes.c_ulong),
+            ("IfType", ctypes.c_ulong),
+            ("OperStatus", ctypes.c_int),
+            ("Ipv6IfIndex", ctypes.c_ulong),
+            ("ZoneIndices", ctypes.c_ulong * 16),
+            ("FirstPrefix", ctypes.c_void_p),
+            ("TransmitLinkSpeed", ctypes.c_ulonglong),
+            ("ReceiveLinkSpeed", ctypes.c_ulonglong),
+            ("FirstWinsServerAddress", ctypes.c_void_p),
+            ("FirstGatewayAddress", ctypes.POINTER(_IP_ADAPTER_ADDR_ENTRY)),
+        ]
+
+        _GetAdaptersAddresses = ctypes.WinDLL("iphlpapi").GetAdaptersAddresses
+        _GetAdaptersAddresses.restype = ctypes.c_ulong
+        _GetAdaptersAddresses.argtypes = [
+            ctypes.c_ulong, ctypes.c_ulong, ctypes.c_void_p,
+            ctypes.c_void_p, ctypes.POINTER(ctypes.c_ulong),
+        ]
+        _HAS_ADAPTERS_API = True
+    except (ImportError, OSError, AttributeError):
+        _HAS_ADAPTERS_API = False
+
+_GAA_FLAG_SKIP_ANYCAST = 0x0002
+_GAA_FLAG_SKIP_MULTICAST = 0x0004
+_GAA_FLAG_INCLUDE_GATEWAYS = 0x0080
+_ERROR_BUFFER_OVERFLOW = 111
+
+# psutil interface addresses/stats snapshot is reused for this many seconds
+INTERFACE_SNAPSHOT_TTL = 2.0
+_if_snapshot: Tuple[float, Optional[tuple]] = (float("-inf"), None)
+_if_snapshot_lock = threading.Lock()
+
+# get_active_interface_info() result is reused for this many seconds
+INTERFACE_INFO_TTL = 5.0
+_iface_cache: Tuple[float, Optional[Dict[str, object]]] = (float("-inf"), None)
+_iface_cache_lock = threading.Lock()
+
+# ipconfig output patterns (JP and EN labels)
+_RE_BLOCK_SEP = re.compile(r"\r?\n\r?\n")
+# Gateway and DNS labels in one alternation; the named group that matched
+# tells which list the IPv4 belongs to
+_RE_GW_DNS = re.compile(
+    r"(?:(?P<gwjp>デフォルト\s*ゲートウェイ)|(?P<gwen>Default Gateway)"
+    r"|(?P<dnsjp>DNS\s*サーバー)|(?P<dnsen>DNS Servers))"
+    r".*?(?P<ip>\d+\.\d+\.\d+\.\d+)"
+)
+_RE_DNS_TAIL = re.compile(r"^\s*(\d+\.\d+\.\d+\.\d+)$", re.MULTILINE)
+_RE_IPV4 = re.compile(r"(\d+\.\d+\.\d+\.\d+)")
+
+# Interface name keywords: VPN / SonicWall / tunnel adapters
+_VPN_RE = re.compile(r"sonicwall|vpn|wan miniport|ppp", re.IGNORECASE)
+
+# Interface name keywords: virtual / non-uplink adapters
+_VIRTUAL_RE = re.compile(
+    "|".join(re.escape(k) for k in [
+        "virtual",
+        "veth",
+        "vethernet",
+        "hyper-v",
+        "wsl",
+        "loopback",
+        "vmware",
+        "virtualbox",
+        "host-only",        # VirtualBox host-only
+        "wi-fi direct",     # MS Wi-Fi Direct
+        "bluetooth",
+    ]),
+    re.IGNORECASE,
+)
+
 if getattr(sys, 'frozen', False):
     BASE_DIR = sys._MEIPASS   # PyInstaller temp folder
+    # _MEIPASS is deleted when the one-file EXE exits, so caches that should
+    # survive a restart live in the user's local app data folder instead
+    CACHE_DIR = os.path.join(
+        os.environ.get("LOCALAPPDATA") or os.path.dirname(sys.executable),
+        "Internet Speed Monitor",
+    )
 else:
     BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+    CACHE_DIR = BASE_DIR
     
 LOG_FILE_PATH = os.path.join(BASE_DIR, "log.txt")
+SPEEDTEST_CACHE_PATH = os.path.join(CACHE_DIR, "speedtest_servers.pkl")
 
 # --- SonicWall SNMP settings (edit for your environment) ---
 # This should be the LAN IP of your SonicWall (very likely your gateway)
@@ -64,44 +184,72 @@ try:
 except ImportError:
     _HAS_PYSNMP = False
 
+# Per-thread SNMP engine/target (SnmpEngine is not thread-safe, and the
+# SonicWall probes run concurrently on the monitor's worker threads)
+_snmp_local = threading.local()
+
 
 # --------------------------------------------------------------------------- #
 # SNMP helpers
 # --------------------------------------------------------------------------- #
-def _snmp_get_numeric(oid: str, timeout: int = 3) -> Optional[float]:
+def _snmp_session(timeout: int):
     """
-    Simple SNMP GET returning numeric value, or None on any error.
+    This thread's (engine, community, target, context), built on first use
+    and reused for every later GET. The target is rebuilt if `timeout` changes.
+    """
+    local = _snmp_local
+    if getattr(local, "engine", None) is None:
+        local.engine = SnmpEngine()
+        local.community = CommunityData(SONICWALL_SNMP_COMMUNITY, mpModel=1)  # v2c
+        local.context = ContextData()
+        local.target = None
+    if local.target is None or local.timeout != timeout:
+        local.target = UdpTransportTarget((SONICWALL_SNMP_IP, SONICWALL_SNMP_PORT), timeout=timeout, retries=1)
+        local.timeout = timeout
+    return local.engine, local.community, local.target, local.context
+
+
+def _snmp_get_many(oids: List[str], timeout: int = 3) -> List[Optional[float]]:
     """
+    SNMP GET of several OIDs in one PDU (one round trip).
+    Returns a numeric value per OID, None for empty OIDs and on any error.
+    """
+    values: List[Optional[float]] = [None] * len(oids)
     if not _HAS_PYSNMP:
-        return None
+        return values
     if not SONICWALL_SNMP_IP or not SONICWALL_SNMP_COMMUNITY:
-        return None
-    if not oid:
-        return None
+        return values
+    wanted = [i for i, oid in enumerate(oids) if oid]
+    if not wanted:
+        return values
 
     try:
         iterator = getCmd(
-            SnmpEngine(),
-            CommunityData(SONICWALL_SNMP_COMMUNITY, mpModel=1),  # v2c
-            UdpTransportTarget((SONICWALL_SNMP_IP, SONICWALL_SNMP_PORT), timeout=timeout, retries=1),
-            ContextData(),
-            ObjectType(ObjectIdentity(oid)),
+            *_snmp_session(timeout),
+            *(ObjectType(ObjectIdentity(oids[i])) for i in wanted),
         )
 
         errorIndication, errorStatus, errorIndex, varBinds = next(iterator)
 
         if errorIndication or errorStatus:
-            return None
+            return values
 
-        for _, val in varBinds:
+        for i, (_, val) in zip(wanted, varBinds):
             try:
-                return float(val)
+                values[i] = float(val)
             except (ValueError, TypeError):
-                return None
+                pass
     except Exception:
-        return None
+        pass
 
-    return None
+    return values
+
+
+def _snmp_get_numeric(oid: str, timeout: int = 3) -> Optional[float]:
+    """
+    Simple SNMP GET returning numeric value, or None on any error.
+    """
+    return _snmp_get_many([oid], timeout=timeout)[0]
 
 
 def get_sonicwall_cpu_load(timeout: int = 3) -> Optional[float]:
@@ -130,13 +278,32 @@ def get_sonicwall_wan_octets(timeout: int = 3) -> Optional[Dict[str, float]]:
     Returns:
       {"in_octets": float, "out_octets": float} or None.
     """
-    in_val = _snmp_get_numeric(SONICWALL_OID_WAN_IN_OCTETS, timeout=timeout)
-    out_val = _snmp_get_numeric(SONICWALL_OID_WAN_OUT_OCTETS, timeout=timeout)
+    in_val, out_val = _snmp_get_many(
+        [SONICWALL_OID_WAN_IN_OCTETS, SONICWALL_OID_WAN_OUT_OCTETS], timeout=timeout
+    )
     if in_val is None or out_val is None:
         return None
     return {"in_octets": in_val, "out_octets": out_val}
 
 
+# --------------------------------------------------------------------------- #
+# Interface snapshot
+# --------------------------------------------------------------------------- #
+def snapshot_interfaces() -> tuple:
+    """
+    Shared (psutil.net_if_addrs(), psutil.net_if_stats()) pair.
+    Re-read at most every INTERFACE_SNAPSHOT_TTL seconds.
+    """
+    global _if_snapshot
+    with _if_snapshot_lock:
+        ts, snap = _if_snapshot
+        now = time.monotonic()
+        if snap is None or now - ts >= INTERFACE_SNAPSHOT_TTL:
+            snap = (psutil.net_if_addrs(), psutil.net_if_stats())
+            _if_snapshot = (now, snap)
+    return snap
+
+
 # --------------------------------------------------------------------------- #
 # VPN detection
 # --------------------------------------------------------------------------- #
@@ -146,17 +313,9 @@ def is_vpn_active() -> bool:
     Looks for any UP interface whose name suggests VPN / SonicWall / tunnel.
     This works well for SonicWall Mobile Connect / NetExtender and many others.
     """
-    stats = psutil.net_if_stats()
+    _, stats = snapshot_interfaces()
     for ifname, s in stats.items():
-        if not s.isup:
-            continue
-        lname = ifname.lower()
-        if any(keyword in lname for keyword in [
-            "sonicwall",
-            "vpn",
-            "wan miniport",
-            "ppp",
-        ]):
+        if s.isup and _VPN_RE.search(ifname):
             return True
     return False
 
@@ -164,18 +323,126 @@ def is_vpn_active() -> bool:
 # --------------------------------------------------------------------------- #
 # Active interface + ipconfig parsing (Japanese Windows aware)
 # --------------------------------------------------------------------------- #
+def _entry_ipv4s(entry) -> List[str]:
+    """IPv4 addresses of a linked list of _IP_ADAPTER_ADDR_ENTRY."""
+    found = []
+    while entry:
+        sa = entry.contents.Address
+        if sa.lpSockaddr and sa.iSockaddrLength >= 8:
+            raw = ctypes.string_at(sa.lpSockaddr, 8)
+            if int.from_bytes(raw[:2], "little") == socket.AF_INET:
+                found.append(socket.inet_ntoa(raw[4:8]))
+        entry = entry.contents.Next
+    return found
+
+
+def _adapter_gateways_dns() -> Optional[Dict[str, tuple]]:
+    """
+    {adapter friendly name: (gateway or None, [dns servers])} for IPv4,
+    read straight from GetAdaptersAddresses. Friendly names are the
+    interface names psutil reports. None if the API is unavailable.
+    """
+    if not _HAS_ADAPTERS_API:
+        return None
+
+    flags = _GAA_FLAG_SKIP_ANYCAST | _GAA_FLAG_SKIP_MULTICAST | _GAA_FLAG_INCLUDE_GATEWAYS
+    size = ctypes.c_ulong(16 * 1024)
+    for _ in range(3):
+        buf = ctypes.create_string_buffer(size.value)
+        ret = _GetAdaptersAddresses(socket.AF_INET, flags, None, buf, ctypes.byref(size))
+        if ret != _ERROR_BUFFER_OVERFLOW:
+            break
+    if ret != 0:
+        return None
+
+    result = {}
+    adapter = ctypes.cast(buf, ctypes.POINTER(_IP_ADAPTER_ADDRESSES))
+    while adapter:
+        a = adapter.contents
+        gateways = _entry_ipv4s(a.FirstGatewayAddress)
+        dns = list(dict.fromkeys(_entry_ipv4s(a.FirstDnsServerAddress)))
+        result[a.FriendlyName] = (gateways[0] if gateways else None, dns)
+        adapter = a.Next
+    return result
+
+
+def _ipconfig_gateways_dns(ipv4_candidates) -> Optional[tuple]:
+    """
+    Fallback for get_active_interface_info when the IP Helper API is not
+    available: parse `ipconfig /all` (JP and EN compatible) and return
+    (ifname, ip, gateway, dns) for the first candidate that has a gateway,
+    or None. Raises if ipconfig cannot be run.
+    """
+    raw = subprocess.check_output(
+        ["ipconfig", "/all"],
+        encoding="utf-8",
+        errors="ignore",
+        startupinfo=HIDE_WINDOW,
+        creationflags=CREATE_NO_WINDOW,
+    )
+
+    blocks = _RE_BLOCK_SEP.split(raw)
+
+    def extract_gateway_dns(block: str):
+        """Extract gateway + dns for this block."""
+        gateway = None
+        dns_list: List[str] = []
+
+        # One scan for all labelled values:
+        # デフォルト ゲートウェイ . . . . . . .: 192.168.227.254   (JP)
+        # Default Gateway . . . . . . . . . : 192.168.1.1       (EN)
+        # DNS サーバー. . . . . . . . .: 61.122.116.132          (JP)
+        # DNS Servers . . . . . . . . . . . : 8.8.8.8           (EN)
+        found = {"gwjp": [], "gwen": [], "dnsjp": [], "dnsen": []}
+        for m in _RE_GW_DNS.finditer(block):
+            label = next(k for k in found if m.group(k) is not None)
+            found[label].append(m.group("ip"))
+
+        gw_all = found["gwjp"] + found["gwen"]
+
+        if gw_all:
+            gateway = gw_all[0]
+
+        # Continuation lines of a multi-value DNS entry:
+        #                             61.122.116.165
+        dns_tail = _RE_DNS_TAIL.findall(block)
+
+        dns_list = found["dnsjp"] + dns_tail + found["dnsen"]
+        dns_list = list(dict.fromkeys(dns_list))
+
+        return gateway, dns_list
+
+    for ifname, ip in ipv4_candidates:
+        for block in blocks:
+            if ifname in block or ip in block:
+                gateway, dns = extract_gateway_dns(block)
+                if gateway:
+                    return ifname, ip, gateway, dns
+    return None
+
+
 def get_active_interface_info() -> Dict[str, object]:
     """
     Best possible interface selector for Japanese Windows.
     - Correctly ignores VirtualBox, Hyper-V, WSL, Wi-Fi Direct, etc.
-    - Correctly detects Japanese labels like:
-        デフォルト ゲートウェイ
-        DNS サーバー
+    - Reads gateways / DNS from the IP Helper API (ipconfig /all only as a
+      fallback, which handles Japanese labels like デフォルト ゲートウェイ)
     - Selects only REAL uplink interface that has:
         • IPv4
         • Gateway present
+    The result is cached for INTERFACE_INFO_TTL seconds.
     """
+    global _iface_cache
+    with _iface_cache_lock:
+        ts, cached = _iface_cache
+        now = time.monotonic()
+        if cached is None or now - ts >= INTERFACE_INFO_TTL:
+            cached = _read_active_interface_info()
+            _iface_cache = (now, cached)
+    return dict(cached)
 
+
+def _read_active_interface_info() -> Dict[str, object]:
     info = {
         "name": None,
         "ip_address": None,
@@ -185,31 +452,13 @@ def get_active_interface_info() -> Dict[str, object]:
         "dns_servers": [],
     }
 
-    addrs = psutil.net_if_addrs()
-    stats = psutil.net_if_stats()
-
-    # ------------ 1. Virtual adapter filter ------------
-    def is_virtual(ifname: str) -> bool:
-        lname = ifname.lower()
-        return any(key in lname for key in [
-            "virtual",
-            "veth",
-            "vethernet",
-            "hyper-v",
-            "wsl",
-            "loopback",
-            "vmware",
-            "virtualbox",
-            "host-only",        # VirtualBox host-only
-            "wi-fi direct",     # MS Wi-Fi Direct
-            "bluetooth",
-        ])
-
-    # ------------ 2. Find real adapters with IPv4 ------------
+    addrs, stats = snapshot_interfaces()
+
+    # ------------ 1. Find real (non-virtual) adapters with IPv4 ------------
     ipv4_candidates = []
 
     for ifname, iface_addrs in addrs.items():
-        if is_virtual(ifname):
+        if _VIRTUAL_RE.search(ifname):
             continue
 
         st = stats.get(ifname)
@@ -228,63 +477,24 @@ def get_active_interface_info() -> Dict[str, object]:
     if not ipv4_candidates:
         return info
 
-    # ------------ 3. Parse ipconfig /all (JP and EN compatible) ------------
+    # ------------ 2. Gateway + DNS per candidate ------------
+    chosen = None
     try:
-        raw = subprocess.check_output(
-            ["ipconfig", "/all"],
-            encoding="utf-8",
-            errors="ignore",
-            startupinfo=HIDE_WINDOW,
-            creationflags=CREATE_NO_WINDOW,
-        )
+        adapters = _adapter_gateways_dns()
     except Exception:
-        return info
-
-    blocks = re.split(r"\r?\n\r?\n", raw)
-
-    def extract_gateway_dns(block: str):
-        """Extract gateway + dns for this block."""
-        gateway = None
-        dns_list: List[str] = []
-
-        # JP format:
-        # デフォルト ゲートウェイ . . . . . . .: 192.168.227.254
-        gw_jp = re.findall(r"デフォルト\s*ゲートウェイ.*?(\d+\.\d+\.\d+\.\d+)", block)
-
-        # EN format:
-        gw_en = re.findall(r"Default Gateway.*?(\d+\.\d+\.\d+\.\d+)", block)
-
-        gw_all = gw_jp + gw_en
-
-        if gw_all:
-            gateway = gw_all[0]
+        adapters = None
 
-        # DNS JP:
-        # DNS サーバー. . . . . . . . .: 61.122.116.132
-        #                             61.122.116.165
-        dns_jp = re.findall(r"DNS\s*サーバー.*?(\d+\.\d+\.\d+\.\d+)", block)
-        dns_jp2 = re.findall(r"^\s*(\d+\.\d+\.\d+\.\d+)$", block, re.MULTILINE)
-
-        # DNS EN:
-        dns_en = re.findall(r"DNS Servers.*?(\d+\.\d+\.\d+\.\d+)", block)
-
-        dns_list = dns_jp + dns_jp2 + dns_en
-        dns_list = list(dict.fromkeys(dns_list))
-
-        return gateway, dns_list
-
-    # ------------ 4. Match candidates to ipconfig blocks ------------
-    chosen = None
-
-    for ifname, ip in ipv4_candidates:
-        for block in blocks:
-            if ifname in block or ip in block:
-                gateway, dns = extract_gateway_dns(block)
-                if gateway:
-                    chosen = (ifname, ip, gateway, dns)
-                    break
-        if chosen:
-            break
+    if adapters is not None:
+        for ifname, ip in ipv4_candidates:
+            gateway, dns = adapters.get(ifname, (None, []))
+            if gateway:
+                chosen = (ifname, ip, gateway, dns)
+                break
+    else:
+        try:
+            chosen = _ipconfig_gateways_dns(ipv4_candidates)
+        except Exception:
+            return info
 
     # If nothing has a gateway (rare), fallback to last real adapter
     if not chosen:
@@ -295,7 +505,7 @@ def get_active_interface_info() -> Dict[str, object]:
 
     ifname, ipaddr, gateway, dns_list = chosen
 
-    # ------------ 5. Build return info ------------
+    # ------------ 3. Build return info ------------
     info["name"] = ifname
     info["ip_address"] = ipaddr
     info["gateway"] = gateway
@@ -354,26 +564,26 @@ def _parse_ipconfig(ip_address: Optional[str]) -> (Optional[str], List[str]):
 
         # --- Default Gateway ---
         if line.lower().startswith("default gateway"):
-            parts = re.findall(r"(\d+\.\d+\.\d+\.\d+)", line)
+            parts = _RE_IPV4.findall(line)
             if parts:
                 gateway = parts[0]
             else:
                 continue
 
         if gateway is None:
-            ipv4 = re.search(r"(\d+\.\d+\.\d+\.\d+)", line)
+            ipv4 = _RE_IPV4.search(line)
             if ipv4:
                 gateway = ipv4.group(1)
 
         # --- DNS Servers ---
         if "dns servers" in line.lower():
             dns_section = True
-            ipv4 = re.findall(r"(\d+\.\d+\.\d+\.\d+)", line)
+            ipv4 = _RE_IPV4.findall(line)
             dns_servers.extend(ipv4)
             continue
 
         if dns_section:
-            ipv4 = re.findall(r"(\d+\.\d+\.\d+\.\d+)", line)
+            ipv4 = _RE_IPV4.findall(line)
             if ipv4:
                 dns_servers.extend(ipv4)
             else:
@@ -384,6 +594,67 @@ def _parse_ipconfig(ip_address: Optional[str]) -> (Optional[str], List[str]):
     return gateway, dns_servers
 
 
+# --------------------------------------------------------------------------- #
+# Keep-alive HTTP
+# --------------------------------------------------------------------------- #
+# Idle keep-alive connections keyed by (scheme, host). A connection is taken
+# out of the table while in use, so concurrent callers never share one.
+_HTTP_IDLE: Dict[Tuple[str, str], HTTPConnection] = {}
+_HTTP_IDLE_LOCK = threading.Lock()
+
+
+def http_request(url: str, method: str = "GET", timeout: float = 5.0) -> Tuple[int, bytes, float]:
+    """
+    Send one request over a reused keep-alive connection to the URL's host.
+
+    Returns (status, body, seconds). `seconds` covers only the exchange that
+    succeeded: an idle connection the server has since dropped is retried
+    once on a fresh one. Redirects are not followed. Raises on network errors.
+    """
+    parts = urlsplit(url)
+    key = (parts.scheme, parts.netloc)
+    path = parts.path or "/"
+    if parts.query:
+        path += "?" + parts.query
+
+    with _HTTP_IDLE_LOCK:
+        conn = _HTTP_IDLE.pop(key, None)
+    reused = conn is not None
+
+    while True:
+        if conn is None:
+            conn_cls = HTTPSConnection if parts.scheme == "https" else HTTPConnection
+            conn = conn_cls(parts.netloc, timeout=timeout)
+        elif conn.sock is not None:
+            conn.sock.settimeout(timeout)
+        try:
+            start = time.perf_counter()
+            conn.request(method, path)
+            resp = conn.getresponse()
+            body = resp.read()
+            elapsed = time.perf_counter() - start
+            break
+        except TimeoutError:
+            conn.close()
+            raise
+        except (HTTPException, OSError):
+            conn.close()
+            if not reused:
+                raise
+            conn, reused = None, False
+
+    if resp.will_close:
+        conn.close()
+    else:
+        with _HTTP_IDLE_LOCK:
+            stale = _HTTP_IDLE.pop(key, None)
+            _HTTP_IDLE[key] = conn
+        if stale is not None:
+            stale.close()
+
+    return resp.status, body, elapsed
+
+
 # --------------------------------------------------------------------------- #
 # Public IP
 # --------------------------------------------------------------------------- #
@@ -392,9 +663,9 @@ def get_public_ip(timeout: int = 5) -> Optional[str]:
     Get public IP from ipify. Returns None if unreachable.
     """
     try:
-        with urlopen("https://api.ipify.org", timeout=timeout) as resp:
-            return resp.read().decode("utf-8").strip()
-    except URLError:
-        return None
+        status, body, _ = http_request("https://api.ipify.org", timeout=timeout)
     except Exception:
         return None
+    if status != 200:
+        return None
+    return body.decode("utf-8").strip()